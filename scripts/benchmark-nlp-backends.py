@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""NLP Backend Benchmark
+
+Compares the "spacy" and "regex" TextProcessor backends (lemmas mode):
+- Throughput: tokens per second for each backend
+- Accuracy: agreement of the regex token stream with the spaCy stream
+  (token-level F1 over aligned lemmas)
+
+Usage:
+    python scripts/benchmark-nlp-backends.py [--input FILE] [--model NAME] [--repeat N]
+"""
+
+import argparse
+import difflib
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.nlp.text_processor import TextProcessor  # noqa: E402
+
+
+def load_texts(input_path: str = None) -> list:
+    """Load paragraphs from a file (default: test fixture text)."""
+    path = Path(input_path or "tests/fixtures/sample_text.txt")
+    paragraphs = [p.strip() for p in path.read_text().split("\n\n")]
+    return [p for p in paragraphs if p]
+
+
+def run_backend(processor: TextProcessor, texts: list, backend: str, repeat: int):
+    """Process texts with a backend, returning (token lists, seconds)."""
+    processor.process_batch(texts[:1], backend=backend)  # warm up model/tables
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        results = processor.process_batch(texts, backend=backend)
+    elapsed = (time.perf_counter() - start) / repeat
+
+    return [result["tokens"] for result in results], elapsed
+
+
+def agreement(reference: list, candidate: list) -> float:
+    """Token-level F1 of candidate lemmas against reference lemmas."""
+    matched = total_ref = total_cand = 0
+    for ref_tokens, cand_tokens in zip(reference, candidate):
+        matcher = difflib.SequenceMatcher(a=ref_tokens, b=cand_tokens, autojunk=False)
+        matched += sum(block.size for block in matcher.get_matching_blocks())
+        total_ref += len(ref_tokens)
+        total_cand += len(cand_tokens)
+
+    if matched == 0:
+        return 0.0
+    precision = matched / total_cand
+    recall = matched / total_ref
+    return 2 * precision * recall / (precision + recall)
+
+
+def main():
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description="Compare TextProcessor backends")
+    parser.add_argument("--input", help="Text file (paragraphs split on blank lines)")
+    parser.add_argument("--model", default="en_core_web_sm", help="spaCy model name or path")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed repetitions")
+    args = parser.parse_args()
+
+    texts = load_texts(args.input)
+    processor = TextProcessor(model=args.model)
+
+    spacy_tokens, spacy_seconds = run_backend(processor, texts, "spacy", args.repeat)
+    regex_tokens, regex_seconds = run_backend(processor, texts, "regex", args.repeat)
+
+    token_count = sum(len(tokens) for tokens in spacy_tokens)
+
+    print("=" * 50)
+    print(f"NLP backend benchmark ({len(texts)} paragraphs, {token_count} tokens)")
+    print("=" * 50)
+    for name, seconds in (("spacy", spacy_seconds), ("regex", regex_seconds)):
+        rate = token_count / seconds if seconds > 0 else float("inf")
+        print(f"  {name:<6} {seconds * 1000:10.1f} ms  {rate:12,.0f} tokens/s")
+
+    print(f"\n  Speedup (regex vs spacy): {spacy_seconds / regex_seconds:.1f}x")
+    print(f"  Lemma agreement (F1):     {agreement(spacy_tokens, regex_tokens):.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,21 +2,26 @@
 
 Components:
 - louvain: Community detection (resolution γ=1.0)
+- leiden: Community detection with well-connected refinement (same parameters)
 - forceatlas2: Graph layout algorithm
 - betweenness: Brandes' betweenness centrality (normalized 0-1)
-- modularity: Newman-Girvan weighted modularity calculator
+- modularity: Newman-Girvan weighted modularity (per-community terms, ΔQ)
 
 All algorithms use EXACT parameters from research specifications.
 """
 
 from .louvain import LouvainCommunityDetection
+from .leiden import LeidenCommunityDetection
 from .forceatlas2 import ForceAtlas2Layout
-from .betweenness import BetweennessCentrality
-from .modularity import ModularityCalculator
+from .betweenness import BetweennessCentrality, IncrementalBetweenness
+from .modularity import ModularityCalculator, PartitionModularity
 
 __all__ = [
     "LouvainCommunityDetection",
+    "LeidenCommunityDetection",
     "ForceAtlas2Layout",
     "BetweennessCentrality",
-    "ModularityCalculator"
+    "IncrementalBetweenness",
+    "ModularityCalculator",
+    "PartitionModularity"
 ]
@@ -0,0 +1,28 @@
+"""Optional Numba JIT
+
+Array kernels in this package are written in Numba's nopython subset.
+When Numba is installed they are compiled; otherwise the decorator is a
+no-op and the same code runs as plain Python (correct, but slower).
+
+Parallel kernels (prange) prefer the OpenMP or workqueue threading layer
+over TBB unless NUMBA_THREADING_LAYER is set: processes forked after TBB
+has started (spaCy's nlp.pipe(n_process=...), the betweenness pool) hang
+on exit.
+"""
+
+import os
+
+try:
+    from numba import config, njit, prange
+    NUMBA_AVAILABLE = True
+    if "NUMBA_THREADING_LAYER" not in os.environ:
+        config.THREADING_LAYER_PRIORITY = ["omp", "workqueue", "tbb"]
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports both decorator forms)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
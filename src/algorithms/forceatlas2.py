@@ -9,65 +9,704 @@ Exact specifications from research:
 - barnesHutOptimize: True
 - barnesHutTheta: 1.2
 - jitterTolerance: 1.0
-- iterations: 500-2000 (based on graph size)
+- iterations: 500-2000 (based on graph size), an upper bound
+
+Engines:
+- "native" (default): ForceAtlas2 on NumPy arrays. Barnes-Hut repulsion
+  uses an array quadtree (Gephi's regions: split at the mass center,
+  size = 2 × max distance to it, opened when distance × θ <= size), built
+  and traversed in Numba kernels; attraction, strong gravity and the
+  swing/traction speed control are vectorized over CSR arrays.
+- "fa2": the fa2 package (reference implementation)
+
+Early stopping (native): every CONVERGENCE_WINDOW iterations the net node
+drift since the previous check is measured relative to the layout radius
+(RMS distance to the centroid). The layout is stable once two consecutive
+windows drift less than the tolerance. Per-iteration displacement is not
+used directly: ForceAtlas2 keeps nodes jittering around their place, so
+it plateaus above zero while the layout itself no longer changes.
+
+Warm start: positions stored as node attributes x/y (apply_layout_to_graph)
+seed the next layout, so the mental map survives graph updates. New nodes
+start at the weighted centroid of their placed neighbors (repeated
+outward for chains of new nodes), and the layout only runs a short
+refinement of at most REFINE_ITERATIONS.
+
+Multilevel (coarsening="matching" or "louvain", native): the graph is
+coarsened by normalized heavy-edge matching or by Louvain local-moving
+levels down to COARSEST_NODES, the coarsest graph gets a full layout with
+an iteration cap sized from its own node count, and positions are
+projected down level by level with LEVEL_ITERATIONS of refinement each.
+Flat layouts cost O(n log n) per iteration for up to 2000 iterations;
+multilevel spends nearly all of them on small graphs.
 """
 
 import networkx as nx
-from fa2 import ForceAtlas2
-from typing import Dict, Tuple
+import numpy as np
+from typing import Any, Dict, Hashable, Tuple, Union
+
+from ..graph.csr_graph import CSRGraph
+from ._numba import njit, prange
+from .louvain import LouvainCommunityDetection
+
+
+@njit(cache=True)
+def _build_quadtree(x: np.ndarray, y: np.ndarray, mass: np.ndarray
+                    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray,
+                               np.ndarray, np.ndarray, np.ndarray, np.ndarray, int]:
+    """Build Barnes-Hut regions over the nodes.
+    
+    Regions are stored breadth-first; the children of a region are
+    contiguous. Leaves hold one node, or several that cannot be split
+    (coincident), placed at their first node.
+    
+    Returns:
+        (region_mass, center_x, center_y, size, first_child, child_count,
+        start, end, order, depth): region k covers nodes
+        order[start[k]:end[k]]; depth is the deepest region level
+    """
+    n = len(x)
+    capacity = 2 * n
+    region_mass = np.zeros(capacity)
+    center_x = np.zeros(capacity)
+    center_y = np.zeros(capacity)
+    size = np.zeros(capacity)
+    first_child = np.zeros(capacity, dtype=np.int64)
+    child_count = np.zeros(capacity, dtype=np.int64)
+    start = np.zeros(capacity, dtype=np.int64)
+    end = np.zeros(capacity, dtype=np.int64)
+    order = np.arange(n)
+    buffer = np.empty(n, dtype=np.int64)
+    bucket = np.empty(n, dtype=np.int64)
+    level = np.zeros(capacity, dtype=np.int64)
+    depth = 0
+    
+    end[0] = n
+    count = 1
+    head = 0
+    while head < count:
+        r = head
+        head += 1
+        lo, hi = start[r], end[r]
+        
+        m = 0.0
+        sx = 0.0
+        sy = 0.0
+        for k in range(lo, hi):
+            i = order[k]
+            m += mass[i]
+            sx += x[i] * mass[i]
+            sy += y[i] * mass[i]
+        cx = sx / m
+        cy = sy / m
+        region_mass[r] = m
+        center_x[r] = x[order[lo]]
+        center_y[r] = y[order[lo]]
+        if hi - lo < 2:
+            continue
+        
+        radius2 = 0.0
+        for k in range(lo, hi):
+            i = order[k]
+            d2 = (x[i] - cx) ** 2 + (y[i] - cy) ** 2
+            if d2 > radius2:
+                radius2 = d2
+        size[r] = 2.0 * np.sqrt(radius2)
+        
+        # Counting sort of the range into the four quadrants
+        counts = np.zeros(4, dtype=np.int64)
+        for k in range(lo, hi):
+            i = order[k]
+            b = (1 if x[i] >= cx else 0) | (2 if y[i] >= cy else 0)
+            bucket[k] = b
+            counts[b] += 1
+        nonempty = 0
+        for b in range(4):
+            if counts[b] > 0:
+                nonempty += 1
+        if nonempty < 2:
+            # Coincident (or float-indistinguishable) nodes: one point mass
+            continue
+        center_x[r] = cx
+        center_y[r] = cy
+        
+        offsets = np.zeros(4, dtype=np.int64)
+        offsets[0] = lo
+        for b in range(1, 4):
+            offsets[b] = offsets[b - 1] + counts[b - 1]
+        first_child[r] = count
+        for b in range(4):
+            if counts[b] > 0:
+                start[count] = offsets[b]
+                end[count] = offsets[b] + counts[b]
+                level[count] = level[r] + 1
+                if level[count] > depth:
+                    depth = level[count]
+                count += 1
+                child_count[r] += 1
+        for k in range(lo, hi):
+            b = bucket[k]
+            buffer[offsets[b]] = order[k]
+            offsets[b] += 1
+        for k in range(lo, hi):
+            order[k] = buffer[k]
+    
+    return region_mass, center_x, center_y, size, first_child, child_count, start, end, order, depth
+
+
+@njit(cache=True, parallel=True)
+def _barnes_hut_repulsion(x: np.ndarray, y: np.ndarray, mass: np.ndarray, theta: float,
+                          coefficient: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Linear repulsion on every node, approximated with a quadtree.
+    
+    Force on n from region r: (pos_n - center_r) * k * m_n * M_r / d².
+    
+    Returns:
+        (fx, fy) force arrays
+    """
+    n = len(x)
+    fx = np.zeros(n)
+    fy = np.zeros(n)
+    if n < 2:
+        return fx, fy
+    region_mass, center_x, center_y, size, first_child, child_count, start, end, order, depth = \
+        _build_quadtree(x, y, mass)
+    
+    for i in prange(n):
+        # Depth-first: at most 3 pending siblings per level plus the current
+        stack = np.empty(3 * depth + 4, dtype=np.int64)
+        stack[0] = 0
+        top = 1
+        xi = x[i]
+        yi = y[i]
+        gx = 0.0
+        gy = 0.0
+        while top > 0:
+            top -= 1
+            r = stack[top]
+            dx = xi - center_x[r]
+            dy = yi - center_y[r]
+            d2 = dx * dx + dy * dy
+            if child_count[r] == 0:
+                # Leaf: a single node or a coincident group (self gives d² = 0)
+                if d2 > 0:
+                    factor = coefficient * mass[i] * region_mass[r] / d2
+                    gx += dx * factor
+                    gy += dy * factor
+            elif np.sqrt(d2) * theta > size[r]:
+                factor = coefficient * mass[i] * region_mass[r] / d2
+                gx += dx * factor
+                gy += dy * factor
+            else:
+                for c in range(first_child[r], first_child[r] + child_count[r]):
+                    stack[top] = c
+                    top += 1
+        fx[i] = gx
+        fy[i] = gy
+    
+    return fx, fy
+
+
+@njit(cache=True, parallel=True)
+def _linear_attraction(indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray,
+                       x: np.ndarray, y: np.ndarray, fx: np.ndarray, fy: np.ndarray) -> None:
+    """Add linear attraction -w * (pos_i - pos_j) over every CSR entry.
+    
+    Both directions of an edge are stored, so both endpoints are pulled.
+    """
+    for i in prange(len(indptr) - 1):
+        gx = 0.0
+        gy = 0.0
+        for p in range(indptr[i], indptr[i + 1]):
+            j = indices[p]
+            gx += weights[p] * (x[i] - x[j])
+            gy += weights[p] * (y[i] - y[j])
+        fx[i] -= gx
+        fy[i] -= gy
+
+
+@njit(cache=True)
+def _heavy_edge_matching(indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray,
+                         size: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """Pair every node with its unmatched neighbor of largest w / (size_u * size_v).
+    
+    Normalizing by the number of original nodes each side stands for keeps
+    coarse nodes balanced instead of growing one heavy cluster.
+    
+    Returns:
+        Coarse node ID per node (0..k-1 in visiting order)
+    """
+    n = len(size)
+    group = np.full(n, -1, dtype=np.int64)
+    k = 0
+    for v in order:
+        if group[v] >= 0:
+            continue
+        best = -1
+        best_score = 0.0
+        for p in range(indptr[v], indptr[v + 1]):
+            u = indices[p]
+            if u == v or group[u] >= 0:
+                continue
+            score = weights[p] / (size[u] * size[v])
+            if score > best_score:
+                best_score = score
+                best = u
+        group[v] = k
+        if best >= 0:
+            group[best] = k
+        k += 1
+    return group
 
 
 class ForceAtlas2Layout:
     """ForceAtlas2 layout with exact InfraNodus configuration."""
     
-    def __init__(self):
-        """Initialize ForceAtlas2 with exact parameters."""
-        self.forceatlas2 = ForceAtlas2(
-            # Behavior alternatives
-            outboundAttractionDistribution=False,
-            linLogMode=False,
-            adjustSizes=False,
-            edgeWeightInfluence=1.0,
-            
-            # Performance
-            jitterTolerance=1.0,
-            barnesHutOptimize=True,
-            barnesHutTheta=1.2,
+    # Exact parameters (specs/parameters.json → algorithms.forceatlas2)
+    GRAVITY = 1.0
+    SCALING_RATIO = 20.0
+    STRONG_GRAVITY_MODE = True
+    EDGE_WEIGHT_INFLUENCE = 1.0
+    BARNES_HUT_THETA = 1.2
+    JITTER_TOLERANCE = 1.0
+    ITERATIONS_SMALL = 1000
+    ITERATIONS_LARGE = 2000
+    ENGINES = ("native", "fa2")
+    
+    # Early stopping: relative drift per window, calm windows in a row
+    CONVERGENCE_WINDOW = 50
+    CONVERGENCE_TOLERANCE = 0.05
+    CONVERGENCE_PATIENCE = 2
+    
+    # Iteration cap and initial global speed when refining persisted positions
+    REFINE_ITERATIONS = 200
+    WARM_START_SPEED = 0.01
+    
+    # Multilevel: coarsen down to COARSEST_NODES, stop when a level keeps
+    # more than COARSENING_MIN_REDUCTION of its nodes
+    COARSENINGS = ("matching", "louvain")
+    COARSEST_NODES = 1000
+    COARSENING_MIN_REDUCTION = 0.8
+    LEVEL_ITERATIONS = 100
+    
+    def __init__(self, engine: str = "native", random_state: int = 42,
+                 tolerance: float = CONVERGENCE_TOLERANCE, coarsening: str = None):
+        """Initialize ForceAtlas2 with exact parameters.
+        
+        Args:
+            engine: "native" (NumPy/Numba arrays) or "fa2"
+            random_state: Seed for the initial random positions (native)
+            tolerance: Relative drift per window below which the layout
+                counts as stable (0 runs every iteration; native only)
+            coarsening: None for flat layouts, or "matching" / "louvain"
+                for multilevel layouts of cold starts (native only)
+        """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine '{engine}', expected one of {self.ENGINES}")
+        if tolerance < 0:
+            raise ValueError("tolerance must be >= 0")
+        if coarsening is not None and coarsening not in self.COARSENINGS:
+            raise ValueError(f"Unknown coarsening '{coarsening}', "
+                             f"expected one of {self.COARSENINGS}")
+        if coarsening is not None and engine != "native":
+            raise ValueError("Multilevel layout requires the native engine")
+        self.engine = engine
+        self.random_state = random_state
+        self.tolerance = tolerance
+        self.coarsening = coarsening
+        self.forceatlas2 = None
+        
+        if engine == "fa2":
+            # Imported lazily: the fa2 build is optional
+            from fa2 import ForceAtlas2
             
-            # Tuning
-            scalingRatio=20.0,
-            strongGravityMode=True,
-            gravity=1.0
-        )
+            self.forceatlas2 = ForceAtlas2(
+                # Behavior alternatives
+                outboundAttractionDistribution=False,
+                linLogMode=False,
+                adjustSizes=False,
+                edgeWeightInfluence=self.EDGE_WEIGHT_INFLUENCE,
+                
+                # Performance
+                jitterTolerance=self.JITTER_TOLERANCE,
+                barnesHutOptimize=True,
+                barnesHutTheta=self.BARNES_HUT_THETA,
+                
+                # Tuning
+                scalingRatio=self.SCALING_RATIO,
+                strongGravityMode=self.STRONG_GRAVITY_MODE,
+                gravity=self.GRAVITY
+            )
     
-    def compute_layout(self, graph: nx.Graph, iterations: int = None) -> Dict[str, Tuple[float, float]]:
+    def compute_layout(self, graph: Union[nx.Graph, CSRGraph], iterations: int = None,
+                       initial_positions: Dict[Hashable, Tuple[float, float]] = None
+                       ) -> Dict[Hashable, Tuple[float, float]]:
         """Compute ForceAtlas2 layout for graph.
         
         Args:
-            graph: NetworkX graph with weighted edges
-            iterations: Number of iterations (auto-determined if None)
+            graph: NetworkX graph or CSRGraph with weighted edges
+            iterations: Maximum number of iterations (auto-determined if None)
+            initial_positions: Optional node → (x, y) to start from (default:
+                the graph's x/y node attributes; {} forces a random start)
         
         Returns:
             Dictionary mapping node to (x, y) coordinates
         """
-        # Auto-determine iterations based on graph size
-        if iterations is None:
-            num_nodes = graph.number_of_nodes()
-            if num_nodes < 500:
-                iterations = 1000
-            else:
-                iterations = 2000
+        return self.compute_layout_with_stats(graph, iterations, initial_positions)["positions"]
+    
+    def compute_layout_with_stats(self, graph: Union[nx.Graph, CSRGraph], iterations: int = None,
+                                  initial_positions: Dict[Hashable, Tuple[float, float]] = None
+                                  ) -> Dict[str, Any]:
+        """Compute ForceAtlas2 layout and report how it converged.
+        
+        Args:
+            graph: NetworkX graph or CSRGraph with weighted edges
+            iterations: Maximum number of iterations (default: the size-based
+                count, or REFINE_ITERATIONS when warm-starting)
+            initial_positions: Optional node → (x, y) to start from (default:
+                the graph's x/y node attributes; {} forces a random start)
+        
+        Returns:
+            Dictionary with:
+            - positions: node → (x, y)
+            - iterations: iterations actually run
+            - converged: True if stopped early because the layout was stable
+            - trace: per-iteration swing, traction and displacement arrays,
+              plus drift per convergence window (empty for the fa2 engine)
+            - levels: multilevel runs only, node count and iterations per
+              level from coarsest to finest (iterations/trace: finest level)
+        """
+        if initial_positions is None:
+            initial_positions = self.stored_positions(graph)
+        csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_networkx(graph)
+        start = self.seed_positions(csr, initial_positions)
+        
+        # Auto-determine the iteration cap based on graph size (multilevel
+        # runs size it from the coarsest graph instead)
+        multilevel = self.coarsening is not None and start is None
+        if iterations is None and not multilevel:
+            iterations = self.default_iterations(graph.number_of_nodes()) if start is None \
+                else self.REFINE_ITERATIONS
+        
+        if self.engine == "fa2":
+            if isinstance(graph, CSRGraph):
+                graph = graph.to_networkx()
+            positions = self.forceatlas2.forceatlas2_networkx_layout(
+                graph,
+                pos=None if start is None else dict(zip(csr.nodes, start.tolist())),
+                iterations=iterations,
+                weight_attr='weight'
+            )
+            empty = np.empty(0)
+            return {
+                "positions": positions,
+                "iterations": iterations,
+                "converged": False,
+                "trace": {"swing": empty, "traction": empty, "displacement": empty, "drift": empty},
+            }
+        
+        if multilevel:
+            result = self.compute_layout_multilevel_csr(csr, iterations)
+        else:
+            result = self.compute_layout_csr(csr, iterations, start)
+        result["positions"] = {node: (float(x), float(y))
+                               for node, (x, y) in zip(csr.nodes, result["positions"].tolist())}
+        return result
+    
+    @staticmethod
+    def stored_positions(graph: Union[nx.Graph, CSRGraph]) -> Dict[Hashable, Tuple[float, float]]:
+        """Positions persisted as x/y node attributes (none for a CSRGraph)."""
+        if isinstance(graph, CSRGraph):
+            return {}
+        return {node: (data["x"], data["y"])
+                for node, data in graph.nodes(data=True) if "x" in data and "y" in data}
+    
+    def seed_positions(self, csr: CSRGraph,
+                       known: Dict[Hashable, Tuple[float, float]]) -> Union[np.ndarray, None]:
+        """Starting positions from known ones, placing the other nodes.
         
-        # Compute positions
-        positions = self.forceatlas2.forceatlas2_networkx_layout(
-            graph,
-            pos=None,
-            iterations=iterations,
-            weight_attr='weight'
-        )
+        Each round places every unplaced node with a placed neighbor at
+        the weight-averaged position of those neighbors, so chains of new
+        nodes grow outward. Nodes never reached (other components) start
+        uniformly in the known bounding box. A small seeded jitter keeps
+        new nodes from coinciding.
         
+        Args:
+            csr: CSRGraph with weighted edges
+            known: Node → (x, y); nodes missing from the graph are ignored
+        
+        Returns:
+            (n, 2) array by node ID, or None if no node is known
+        """
+        n = csr.number_of_nodes()
+        positions = np.zeros((n, 2))
+        placed = np.zeros(n, dtype=bool)
+        for node, xy in known.items():
+            i = csr.node_index.get(node)
+            if i is not None:
+                positions[i] = xy
+                placed[i] = True
+        if not placed.any():
+            return None
+        if placed.all():
+            return positions
+        
+        rng = np.random.default_rng(self.random_state)
+        low = positions[placed].min(axis=0)
+        high = positions[placed].max(axis=0)
+        jitter = 0.01 * max(float(np.max(high - low)), 1.0)
+        
+        rows = csr.row_ids()
+        while True:
+            # Entries from an unplaced node to a placed neighbor
+            reach = ~placed[rows] & placed[csr.indices]
+            if not reach.any():
+                break
+            sources, weights = rows[reach], csr.weights[reach]
+            neighbors = positions[csr.indices[reach]]
+            total = np.bincount(sources, weights=weights, minlength=n)
+            new = np.flatnonzero(total > 0)
+            for axis in range(2):
+                summed = np.bincount(sources, weights=weights * neighbors[:, axis], minlength=n)
+                positions[new, axis] = summed[new] / total[new]
+            positions[new] += rng.normal(scale=jitter, size=(len(new), 2))
+            placed[new] = True
+        
+        rest = np.flatnonzero(~placed)
+        positions[rest] = low + rng.random((len(rest), 2)) * (high - low + jitter)
         return positions
     
+    def default_iterations(self, num_nodes: int) -> int:
+        """Iteration count for a graph size (1000 below 500 nodes, else 2000)."""
+        return self.ITERATIONS_SMALL if num_nodes < 500 else self.ITERATIONS_LARGE
+    
+    def compute_layout_multilevel_csr(self, csr: CSRGraph, iterations: int = None
+                                      ) -> Dict[str, Any]:
+        """Coarsen, lay out the coarsest graph, then refine level by level.
+        
+        Coarse nodes carry the summed mass of their members, so every level
+        settles at roughly the scale of the finest one. Projected children
+        start at their parent with a jitter of a tenth of the coarse mean
+        edge length, and each finer level runs at most LEVEL_ITERATIONS.
+        
+        Args:
+            csr: CSRGraph with weighted edges
+            iterations: Maximum number of iterations on the coarsest level
+                (default: the size-based count for the coarsest graph)
+        
+        Returns:
+            Same keys as compute_layout_csr plus "levels"
+        """
+        # (graph, mass, original nodes represented) per level, finest first
+        levels = [(csr, self._mass(csr), np.ones(csr.number_of_nodes()))]
+        groups = []
+        rng = np.random.default_rng(self.random_state)
+        while levels[-1][0].number_of_nodes() > self.COARSEST_NODES:
+            fine, mass, members = levels[-1]
+            group = self._coarsen(fine, members, rng)
+            size = group.max() + 1
+            if size > self.COARSENING_MIN_REDUCTION * fine.number_of_nodes():
+                break
+            levels.append((fine.aggregate(group), np.bincount(group, weights=mass),
+                           np.bincount(group, weights=members)))
+            groups.append(group)
+        
+        coarse, mass, _ = levels.pop()
+        if iterations is None:
+            iterations = self.default_iterations(coarse.number_of_nodes())
+        result = self.compute_layout_csr(coarse, iterations, mass=mass)
+        summary = [{"nodes": coarse.number_of_nodes(), "iterations": result["iterations"]}]
+        while groups:
+            group = groups.pop()
+            fine, mass, _ = levels.pop()
+            coarse_positions = result["positions"]
+            jitter = 0.1 * self._mean_edge_length(coarse, coarse_positions)
+            positions = coarse_positions[group] + rng.normal(scale=jitter, size=(len(group), 2))
+            result = self.compute_layout_csr(fine, self.LEVEL_ITERATIONS, positions, mass)
+            summary.append({"nodes": fine.number_of_nodes(), "iterations": result["iterations"]})
+            coarse = fine
+        
+        result["levels"] = summary
+        return result
+    
+    def _coarsen(self, csr: CSRGraph, members: np.ndarray,
+                 rng: np.random.Generator) -> np.ndarray:
+        """Coarse node ID per node for one multilevel step.
+        
+        "louvain" merges the communities of one Louvain local-moving level;
+        "matching" pairs nodes by heavy-edge matching over member counts.
+        """
+        if self.coarsening == "louvain":
+            return LouvainCommunityDetection(random_state=self.random_state).detect_level_csr(
+                csr, rng
+            )
+        
+        return _heavy_edge_matching(csr.indptr, csr.indices, csr.weights, members,
+                                    rng.permutation(csr.number_of_nodes()))
+    
+    @staticmethod
+    def _mean_edge_length(csr: CSRGraph, positions: np.ndarray) -> float:
+        """Mean Euclidean length of the non-loop edges (1 if there are none)."""
+        rows = csr.row_ids()
+        links = rows != csr.indices
+        if not links.any():
+            return 1.0
+        delta = positions[rows[links]] - positions[csr.indices[links]]
+        return float(np.mean(np.hypot(delta[:, 0], delta[:, 1])))
+    
+    @staticmethod
+    def _mass(csr: CSRGraph) -> np.ndarray:
+        """ForceAtlas2 mass: 1 + number of neighbors (a self-loop counts once)."""
+        return 1.0 + np.diff(csr.indptr)
+    
+    def compute_layout_csr(self, csr: CSRGraph, iterations: int, positions: np.ndarray = None,
+                           mass: np.ndarray = None) -> Dict[str, Any]:
+        """Run native ForceAtlas2 on a CSR graph until stable or capped.
+        
+        Args:
+            csr: CSRGraph with weighted edges
+            iterations: Maximum number of iterations
+            positions: Optional (n, 2) starting positions, refined from
+                WARM_START_SPEED (default: seeded uniform random in [0, 1))
+            mass: Optional node masses (default: 1 + number of neighbors)
+        
+        Returns:
+            Same keys as compute_layout_with_stats, with positions as an
+            (n, 2) array by node ID
+        """
+        n = csr.number_of_nodes()
+        if n == 0:
+            empty = np.empty(0)
+            return {
+                "positions": np.empty((0, 2)),
+                "iterations": 0,
+                "converged": True,
+                "trace": {"swing": empty, "traction": empty, "displacement": empty, "drift": empty},
+            }
+        
+        warm = positions is not None
+        if not warm:
+            positions = np.random.default_rng(self.random_state).random((n, 2))
+        x = np.array(positions[:, 0], dtype=np.float64)
+        y = np.array(positions[:, 1], dtype=np.float64)
+        
+        if mass is None:
+            mass = self._mass(csr)
+        weights = csr.weights ** self.EDGE_WEIGHT_INFLUENCE
+        
+        fx = np.zeros(n)
+        fy = np.zeros(n)
+        # Cold starts use Gephi's initial speed; warm starts begin slow so
+        # settled nodes are not flung before the speed control adapts
+        speed = self.WARM_START_SPEED if warm else 1.0
+        speed_efficiency = 1.0
+        swing = np.zeros(iterations)
+        traction = np.zeros(iterations)
+        displacement = np.zeros(iterations)
+        drift = []
+        anchor_x, anchor_y = x.copy(), y.copy()
+        calm_windows = 0
+        converged = False
+        done = 0
+        while done < iterations and not converged:
+            old_fx, old_fy = fx, fy
+            
+            # Repulsion (Barnes-Hut)
+            fx, fy = _barnes_hut_repulsion(x, y, mass, self.BARNES_HUT_THETA,
+                                           self.SCALING_RATIO)
+            
+            # Strong gravity: distance-independent pull to the origin
+            pull = self.SCALING_RATIO * mass * self.GRAVITY
+            fx -= x * pull
+            fy -= y * pull
+            
+            # Linear attraction along edges
+            _linear_attraction(csr.indptr, csr.indices, weights, x, y, fx, fy)
+            
+            (speed, speed_efficiency, swing[done], traction[done],
+             displacement[done]) = self._apply_forces(
+                x, y, fx, fy, old_fx, old_fy, mass, speed, speed_efficiency
+            )
+            done += 1
+            
+            if self.tolerance > 0 and done % self.CONVERGENCE_WINDOW == 0:
+                drift.append(self._relative_drift(anchor_x, anchor_y, x, y))
+                calm_windows = calm_windows + 1 if drift[-1] < self.tolerance else 0
+                converged = calm_windows >= self.CONVERGENCE_PATIENCE
+                anchor_x, anchor_y = x.copy(), y.copy()
+        
+        return {
+            "positions": np.column_stack((x, y)),
+            "iterations": done,
+            "converged": converged,
+            "trace": {
+                "swing": swing[:done],
+                "traction": traction[:done],
+                "displacement": displacement[:done],
+                "drift": np.array(drift),
+            },
+        }
+    
+    @staticmethod
+    def _relative_drift(old_x: np.ndarray, old_y: np.ndarray,
+                        x: np.ndarray, y: np.ndarray) -> float:
+        """Mean node movement divided by the layout's RMS radius (0 if degenerate)."""
+        radius = np.sqrt(np.mean((x - x.mean()) ** 2 + (y - y.mean()) ** 2))
+        if radius == 0:
+            return 0.0
+        return float(np.mean(np.hypot(x - old_x, y - old_y)) / radius)
+    
+    def _apply_forces(self, x: np.ndarray, y: np.ndarray, fx: np.ndarray, fy: np.ndarray,
+                      old_fx: np.ndarray, old_fy: np.ndarray, mass: np.ndarray,
+                      speed: float, speed_efficiency: float) -> Tuple[float, ...]:
+        """Adapt global speed from swing/traction and move nodes in place.
+        
+        Returns:
+            Updated (speed, speed_efficiency), then this iteration's global
+            swing, global traction and mean node displacement
+        """
+        n = len(x)
+        swinging = mass * np.hypot(old_fx - fx, old_fy - fy)
+        total_swinging = swinging.sum()
+        total_traction = 0.5 * np.sum(mass * np.hypot(old_fx + fx, old_fy + fy))
+        
+        # Jitter tolerance estimated from graph size (Gephi's heuristic)
+        estimated_jt = 0.05 * np.sqrt(n)
+        min_jt = np.sqrt(estimated_jt)
+        max_jt = 10.0
+        if n > 0 and total_traction > 0:
+            jt = self.JITTER_TOLERANCE * max(
+                min_jt, min(max_jt, estimated_jt * total_traction / (n * n))
+            )
+        else:
+            jt = self.JITTER_TOLERANCE * min_jt
+        
+        min_speed_efficiency = 0.05
+        if total_traction > 0 and total_swinging / total_traction > 2.0:
+            if speed_efficiency > min_speed_efficiency:
+                speed_efficiency *= 0.5
+            jt = max(jt, self.JITTER_TOLERANCE)
+        
+        if total_swinging == 0:
+            target_speed = float("inf")
+        else:
+            target_speed = jt * speed_efficiency * total_traction / total_swinging
+        
+        if total_swinging > jt * total_traction:
+            if speed_efficiency > min_speed_efficiency:
+                speed_efficiency *= 0.7
+        elif speed < 1000:
+            speed_efficiency *= 1.3
+        
+        max_rise = 0.5
+        speed = speed + min(target_speed - speed, max_rise * speed)
+        
+        factor = speed / (1.0 + np.sqrt(speed * swinging))
+        x += fx * factor
+        y += fy * factor
+        displacement = float(np.mean(np.hypot(fx, fy) * factor)) if n else 0.0
+        return speed, speed_efficiency, float(total_swinging), float(total_traction), displacement
+    
     def apply_layout_to_graph(self, graph: nx.Graph, positions: Dict[str, Tuple[float, float]]) -> nx.Graph:
         """Apply computed positions to graph node attributes.
         
@@ -5,47 +5,347 @@ Exact specifications:
 - Weighted: True (uses edge weights)
 - Stopping criteria: ΔQ < 0.0001
 - Random seed: Fixed for reproducibility
+
+Engines:
+- "native" (default): array-based Louvain on a CSR adjacency. Local
+  moving runs in a Numba-compiled kernel; aggregation into the
+  community graph is vectorized NumPy. Multi-level until ΔQ < 0.0001.
+- "python-louvain": community.best_partition (reference implementation)
+
+Warm start (native engine): after small graph edits, pass the previous
+partition and the changed nodes. The first level starts from the
+previous communities and only revisits nodes near the changes (plus
+neighbors of nodes that move), then aggregation runs as usual. Final
+community IDs are matched to the previous ones by overlap so they stay
+stable across runs (no color reshuffling in the UI).
 """
 
 import networkx as nx
+import numpy as np
 import community as community_louvain  # python-louvain
-from typing import Dict, Any
+from collections import Counter
+from typing import Dict, Any, Hashable, Iterable, Optional, Tuple, Union
+
+from ..graph.csr_graph import CSRGraph, aggregate_csr
+from ._numba import njit
+from .modularity import PartitionModularity
+
+
+@njit(cache=True)
+def _move_nodes(indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray,
+                strength: np.ndarray, community: np.ndarray, tot: np.ndarray,
+                order: np.ndarray, resolution: float, m2: float) -> int:
+    """One local-moving pass: move each node in order to its best neighbor community.
+    
+    Gain of moving node i (removed from its community) into community c:
+    w(i, c) - γ · tot(c) · k(i) / 2m
+    
+    Returns:
+        Number of nodes that changed community
+    """
+    n = len(strength)
+    neigh_weight = np.zeros(n)
+    neigh_comms = np.empty(n, dtype=np.int64)
+    is_neigh = np.zeros(n, dtype=np.bool_)
+    moved = 0
+    
+    for idx in range(len(order)):
+        i = order[idx]
+        ci = community[i]
+        ki = strength[i]
+        
+        count = 0
+        for p in range(indptr[i], indptr[i + 1]):
+            j = indices[p]
+            if j == i:
+                continue
+            cj = community[j]
+            if not is_neigh[cj]:
+                is_neigh[cj] = True
+                neigh_comms[count] = cj
+                count += 1
+            neigh_weight[cj] += weights[p]
+        
+        tot[ci] -= ki
+        best_c = ci
+        best_gain = neigh_weight[ci] - resolution * tot[ci] * ki / m2
+        for t in range(count):
+            c = neigh_comms[t]
+            gain = neigh_weight[c] - resolution * tot[c] * ki / m2
+            if gain > best_gain:
+                best_gain = gain
+                best_c = c
+        tot[best_c] += ki
+        community[i] = best_c
+        if best_c != ci:
+            moved += 1
+        
+        for t in range(count):
+            c = neigh_comms[t]
+            neigh_weight[c] = 0.0
+            is_neigh[c] = False
+    
+    return moved
 
 
 class LouvainCommunityDetection:
     """Louvain algorithm with exact InfraNodus specifications."""
     
-    def __init__(self, resolution: float = 1.0, random_state: int = 42):
+    # Stop when a pass or level improves modularity by less than this
+    MIN_MODULARITY_GAIN = 0.0001
+    ENGINES: Tuple[str, ...] = ("native", "python-louvain")
+    
+    def __init__(self, resolution: float = 1.0, random_state: int = 42,
+                 engine: str = "native"):
         """Initialize Louvain community detection.
         
         Args:
             resolution: Resolution parameter (default: 1.0)
             random_state: Random seed for reproducibility
+            engine: "native" (CSR arrays) or "python-louvain"
         """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine '{engine}', expected one of {self.ENGINES}")
         self.resolution = resolution
         self.random_state = random_state
+        self.engine = engine
     
-    def detect_communities(self, graph: nx.Graph) -> Dict[str, int]:
+    def detect_communities(self, graph: Union[nx.Graph, CSRGraph],
+                           previous_partition: Dict[Hashable, int] = None,
+                           changed_nodes: Iterable[Hashable] = None) -> Dict[Hashable, int]:
         """Detect communities using Louvain algorithm.
         
         Args:
-            graph: NetworkX graph with weighted edges
+            graph: NetworkX graph or CSRGraph with weighted edges
+            previous_partition: Optional earlier result to warm-start from;
+                community IDs are kept stable against it
+            changed_nodes: Nodes incident to edges changed since the previous
+                partition (e.g. GraphBuilder.append_ngrams "nodes_touched");
+                only they and their neighbors are revisited first
         
         Returns:
             Dictionary mapping node to community ID
         """
-        # Use python-louvain library
-        # Weight attribute should be 'weight' (default)
-        partition = community_louvain.best_partition(
-            graph,
-            weight='weight',
-            resolution=self.resolution,
-            random_state=self.random_state
-        )
+        if self.engine == "python-louvain":
+            if isinstance(graph, CSRGraph):
+                graph = graph.to_networkx()
+            # Weight attribute should be 'weight' (default)
+            partition = community_louvain.best_partition(
+                graph,
+                partition=self._known_nodes(graph, previous_partition),
+                weight='weight',
+                resolution=self.resolution,
+                random_state=self.random_state
+            )
+            return self._stabilize(partition, previous_partition)
+        
+        csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_networkx(graph)
+        
+        initial = active = None
+        if previous_partition:
+            initial = self._initial_communities(csr, previous_partition)
+            if changed_nodes is not None:
+                active = self._neighborhood(csr, changed_nodes)
+        
+        labels = self.detect_communities_csr(csr, initial, active)
+        return self._stabilize(dict(zip(csr.nodes, labels.tolist())), previous_partition)
+    
+    def detect_communities_csr(self, csr: CSRGraph, initial: np.ndarray = None,
+                               active: np.ndarray = None) -> np.ndarray:
+        """Run the native multi-level Louvain on a CSR graph.
+        
+        Args:
+            csr: CSRGraph with weighted edges
+            initial: Optional starting community per node ID (values < n)
+            active: Optional node IDs to revisit on the first level (requires
+                initial; nodes that move activate their neighbors)
         
+        Returns:
+            Community ID per node ID, numbered 0..k-1 by first appearance
+        """
+        rng = np.random.default_rng(self.random_state)
+        n = csr.number_of_nodes()
+        partition = np.arange(n, dtype=np.int64)
+        
+        indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+        strength = csr.strength()
+        m2 = strength.sum()
+        if m2 == 0:
+            return partition
+        
+        # A warm-started first level is always kept and aggregated once, so
+        # communities the edits made worth merging can still merge
+        warm = initial is not None
+        start = initial if warm else np.arange(n, dtype=np.int64)
+        modularity = self._level_modularity(indptr, indices, weights, start)
+        while True:
+            community = self._one_level(indptr, indices, weights, strength, m2, rng,
+                                        initial, active)
+            new_modularity = self._level_modularity(indptr, indices, weights, community)
+            if new_modularity <= modularity and not warm:
+                break
+            
+            # Renumber level communities 0..c-1 and project onto the nodes
+            _, community = np.unique(community, return_inverse=True)
+            partition = community[partition]
+            
+            gain = new_modularity - modularity
+            if (gain < self.MIN_MODULARITY_GAIN and not warm) or \
+                    community.max() + 1 == len(strength):
+                break
+            modularity = new_modularity
+            warm, initial, active = False, None, None
+            
+            indptr, indices, weights = aggregate_csr(indptr, indices, weights, community)
+            strength = np.bincount(community, weights=strength)
+        
+        return self._renumber(partition)
+    
+    def detect_level_csr(self, csr: CSRGraph, rng: np.random.Generator = None) -> np.ndarray:
+        """Run one Louvain level (local moving only, no aggregation).
+        
+        Args:
+            csr: CSRGraph with weighted edges
+            rng: Optional generator for the node visiting order (default:
+                seeded from random_state)
+        
+        Returns:
+            Community ID per node ID, numbered 0..k-1 in label order
+        """
+        if rng is None:
+            rng = np.random.default_rng(self.random_state)
+        strength = csr.strength()
+        m2 = float(strength.sum())
+        if m2 == 0:
+            return np.arange(csr.number_of_nodes(), dtype=np.int64)
+        community = self._one_level(csr.indptr, csr.indices, csr.weights, strength, m2, rng)
+        return np.unique(community, return_inverse=True)[1].ravel()
+    
+    def _one_level(self, indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray,
+                   strength: np.ndarray, m2: float, rng: np.random.Generator,
+                   initial: np.ndarray = None, active: np.ndarray = None) -> np.ndarray:
+        """Repeat local-moving passes until no node moves or ΔQ < 0.0001."""
+        n = len(strength)
+        if initial is None:
+            community = np.arange(n, dtype=np.int64)
+        else:
+            community = np.asarray(initial, dtype=np.int64).copy()
+        tot = np.bincount(community, weights=strength, minlength=n).astype(np.float64)
+        
+        modularity = self._level_modularity(indptr, indices, weights, community)
+        while True:
+            if active is None:
+                order = rng.permutation(n)
+            else:
+                order = rng.permutation(active)
+                before = community.copy()
+            
+            moved = _move_nodes(indptr, indices, weights, strength, community, tot, order,
+                                float(self.resolution), float(m2))
+            if moved == 0:
+                break
+            
+            if active is not None:
+                # Nodes that moved, and their neighbors, are revisited next
+                moved_nodes = np.flatnonzero(community != before)
+                active = np.unique(np.concatenate(
+                    [moved_nodes] + [indices[indptr[i]:indptr[i + 1]] for i in moved_nodes]
+                ))
+            
+            new_modularity = self._level_modularity(indptr, indices, weights, community)
+            if new_modularity - modularity < self.MIN_MODULARITY_GAIN:
+                break
+            modularity = new_modularity
+        
+        return community
+    
+    def _level_modularity(self, indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray,
+                          community: np.ndarray) -> float:
+        """Weighted modularity of a partition of a (possibly aggregated) CSR graph.
+        
+        Q = Σ_c [ in(c) / 2m - γ (tot(c) / 2m)² ], where in(c) counts every
+        internal edge from both endpoints (self-loops twice).
+        """
+        return PartitionModularity(indptr, indices, weights, community, self.resolution).modularity
+    
+    @staticmethod
+    def _known_nodes(graph: nx.Graph, previous_partition: Optional[Dict[Hashable, int]]
+                     ) -> Optional[Dict[Hashable, int]]:
+        """Previous partition restricted to the graph, new nodes as singletons."""
+        if not previous_partition:
+            return None
+        partition = {node: previous_partition[node] for node in graph.nodes()
+                     if node in previous_partition}
+        next_id = max(previous_partition.values(), default=-1) + 1
+        for node in graph.nodes():
+            if node not in partition:
+                partition[node] = next_id
+                next_id += 1
         return partition
     
-    def get_modularity(self, graph: nx.Graph, partition: Dict[str, int]) -> float:
+    @staticmethod
+    def _initial_communities(csr: CSRGraph, previous_partition: Dict[Hashable, int]) -> np.ndarray:
+        """Starting community per node ID from a previous partition.
+        
+        Previous IDs are compacted to 0..k-1; nodes without a previous
+        community (new nodes) start as singletons.
+        """
+        previous = {}
+        initial = np.empty(csr.number_of_nodes(), dtype=np.int64)
+        for i, node in enumerate(csr.nodes):
+            key = ("previous", previous_partition[node]) if node in previous_partition \
+                else ("new", i)
+            initial[i] = previous.setdefault(key, len(previous))
+        return initial
+    
+    @staticmethod
+    def _neighborhood(csr: CSRGraph, nodes: Iterable[Hashable]) -> np.ndarray:
+        """Node IDs of the given nodes plus their direct neighbors."""
+        ids = [csr.node_index[node] for node in nodes if node in csr.node_index]
+        if not ids:
+            return np.empty(0, dtype=np.int64)
+        parts = [np.asarray(ids, dtype=np.int64)] + [csr.neighbors(i) for i in ids]
+        return np.unique(np.concatenate(parts)).astype(np.int64)
+    
+    @staticmethod
+    def _stabilize(partition: Dict[Hashable, int],
+                   previous_partition: Optional[Dict[Hashable, int]]) -> Dict[Hashable, int]:
+        """Relabel communities to match previous IDs by largest node overlap.
+        
+        Pairs (new, previous) are matched greedily by overlap size; new
+        communities without a match get fresh IDs above the previous ones.
+        """
+        if not previous_partition:
+            return partition
+        
+        overlap = Counter(
+            (community, previous_partition[node])
+            for node, community in partition.items() if node in previous_partition
+        )
+        mapping, used = {}, set()
+        for (community, previous), _ in sorted(overlap.items(),
+                                               key=lambda item: (-item[1], item[0])):
+            if community not in mapping and previous not in used:
+                mapping[community] = previous
+                used.add(previous)
+        
+        next_id = max(previous_partition.values(), default=-1) + 1
+        for community in partition.values():
+            if community not in mapping:
+                mapping[community] = next_id
+                next_id += 1
+        
+        return {node: mapping[community] for node, community in partition.items()}
+    
+    @staticmethod
+    def _renumber(partition: np.ndarray) -> np.ndarray:
+        """Renumber communities 0..k-1 in order of their first node."""
+        _, first, inverse = np.unique(partition, return_index=True, return_inverse=True)
+        rank = np.empty(len(first), dtype=np.int64)
+        rank[np.argsort(first)] = np.arange(len(first))
+        return rank[inverse.ravel()]
+    
+    def get_modularity(self, graph: nx.Graph, partition: Dict[Hashable, int]) -> float:
         """Calculate modularity of partition.
         
         Args:
@@ -55,14 +355,9 @@ class LouvainCommunityDetection:
         Returns:
             Modularity value (higher = better community structure)
         """
-        modularity = community_louvain.modularity(
-            partition,
-            graph,
-            weight='weight'
-        )
-        return modularity
+        return PartitionModularity.from_graph(graph, partition).modularity
     
-    def get_community_stats(self, partition: Dict[str, int]) -> Dict[str, Any]:
+    def get_community_stats(self, partition: Dict[Hashable, int]) -> Dict[str, Any]:
         """Get statistics about detected communities.
         
         Args:
@@ -6,10 +6,142 @@ Q = (1/2m) Σ [Aᵢⱼ - (kᵢkⱼ)/(2m)] δ(cᵢ,cⱼ)
 Thresholds:
 - Q > 0.4: Strong community structure
 - Q > 0.7: Very strong (possibly disconnected)
+
+PartitionModularity evaluates Q on CSR arrays in one O(E) pass: bincounts
+over community labels give each community's internal weight in(c) and
+total strength tot(c), so
+Q = Σ_c [ in(c) / 2m - γ (tot(c) / 2m)² ]
+splits into per-community contributions, and the ΔQ of moving one node
+costs O(degree). ModularityCalculator and Louvain's modularity reports
+share it.
 """
 
 import networkx as nx
-from typing import Dict
+import numpy as np
+from typing import Any, Dict, Hashable, Optional, Sequence, Union
+
+from ..graph.csr_graph import CSRGraph
+
+
+class PartitionModularity:
+    """Modularity of one partition, with per-community terms and ΔQ moves."""
+    
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray,
+                 labels: np.ndarray, resolution: float = 1.0,
+                 community_ids: Optional[Sequence[Any]] = None):
+        """Compute community sums for a partition of a CSR adjacency.
+        
+        Args:
+            indptr: CSR row pointers (undirected, both directions stored)
+            indices: CSR neighbor IDs
+            weights: CSR edge weights
+            labels: Community label per node ID (values 0..k-1)
+            resolution: Resolution γ (default: 1.0)
+            community_ids: Optional community ID per label (default: the labels)
+        """
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.labels = np.asarray(labels, dtype=np.int64)
+        self.resolution = resolution
+        
+        n = len(self.labels)
+        k = int(self.labels.max()) + 1 if n else 0
+        rows = np.repeat(np.arange(n), np.diff(indptr))
+        # Self-loops are stored once but count twice in degree and in(c)
+        doubled = np.where(rows == indices, 2 * weights, weights)
+        self.strength = np.bincount(rows, weights=doubled, minlength=n)
+        self.m2 = float(self.strength.sum())
+        
+        internal = self.labels[rows] == self.labels[indices]
+        self.internal = np.bincount(self.labels[rows[internal]], weights=doubled[internal],
+                                    minlength=k)
+        self.total = np.bincount(self.labels, weights=self.strength, minlength=k)
+        self.community_ids = list(range(k)) if community_ids is None else list(community_ids)
+    
+    @classmethod
+    def from_graph(cls, graph: Union[nx.Graph, CSRGraph], communities: Dict[Hashable, Any],
+                   resolution: float = 1.0) -> "PartitionModularity":
+        """Build from a graph and a node → community ID mapping.
+        
+        Args:
+            graph: NetworkX graph or CSRGraph with weighted edges
+            communities: Community ID of every node (any hashable IDs)
+            resolution: Resolution γ (default: 1.0)
+        
+        Returns:
+            PartitionModularity with labels in order of first appearance
+        
+        Raises:
+            ValueError: If a node of the graph has no community
+        """
+        csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_networkx(graph)
+        label_of: Dict[Any, int] = {}
+        try:
+            labels = np.fromiter(
+                (label_of.setdefault(communities[node], len(label_of)) for node in csr.nodes),
+                dtype=np.int64, count=csr.number_of_nodes()
+            )
+        except KeyError as error:
+            raise ValueError(f"Node {error.args[0]!r} has no community") from None
+        
+        return cls(csr.indptr, csr.indices, csr.weights, labels, resolution, list(label_of))
+    
+    @property
+    def modularity(self) -> float:
+        """Global Q (0 for graphs without edges)."""
+        return float(self.contributions().sum())
+    
+    def contributions(self) -> np.ndarray:
+        """Per-label term in(c) / 2m - γ (tot(c) / 2m)²; they sum to Q."""
+        if self.m2 == 0:
+            return np.zeros(len(self.total))
+        return self.internal / self.m2 - self.resolution * (self.total / self.m2) ** 2
+    
+    def delta(self, node: int, target: int) -> float:
+        """ΔQ of moving one node to another community.
+        
+        ΔQ = 2 (k_i,b - k_i,a) / 2m - 2γ k_i (tot_b - tot_a + k_i) / (2m)²
+        with a the node's community (without the node), b the target and
+        k_i,c the node's edge weight into c. Self-loops cancel out.
+        
+        Args:
+            node: Node ID
+            target: Target label (labels >= k mean a new, empty community)
+        
+        Returns:
+            Change in Q (0 if target is the node's own community)
+        """
+        source = self.labels[node]
+        if target == source or self.m2 == 0:
+            return 0.0
+        
+        start, end = self.indptr[node], self.indptr[node + 1]
+        neighbors = self.indices[start:end]
+        weights = self.weights[start:end]
+        links = neighbors != node
+        neighbor_labels = self.labels[neighbors[links]]
+        to_source = weights[links][neighbor_labels == source].sum()
+        to_target = weights[links][neighbor_labels == target].sum()
+        
+        k = self.strength[node]
+        total_target = self.total[target] if target < len(self.total) else 0.0
+        total_source = self.total[source]
+        return float(2 * (to_target - to_source) / self.m2
+                     - 2 * self.resolution * k * (total_target - total_source + k) / self.m2 ** 2)
+    
+    def breakdown(self) -> Dict[str, Any]:
+        """Global Q and each community's contribution, keyed by community ID.
+        
+        Returns:
+            Dictionary with modularity and contributions (community ID → term)
+        """
+        contributions = self.contributions()
+        return {
+            "modularity": float(contributions.sum()),
+            "contributions": {cid: float(value)
+                              for cid, value in zip(self.community_ids, contributions)}
+        }
 
 
 class ModularityCalculator:
@@ -20,7 +152,7 @@ class ModularityCalculator:
     VERY_STRONG_THRESHOLD = 0.7
     
     @staticmethod
-    def calculate(graph: nx.Graph, communities: Dict[str, int]) -> float:
+    def calculate(graph: nx.Graph, communities: Dict[Hashable, int]) -> float:
         """Calculate weighted modularity.
         
         Args:
@@ -30,19 +162,21 @@ class ModularityCalculator:
         Returns:
             Modularity value Q
         """
-        # Convert community dict to list of sets format
-        community_sets = {}
-        for node, comm_id in communities.items():
-            if comm_id not in community_sets:
-                community_sets[comm_id] = set()
-            community_sets[comm_id].add(node)
-        
-        community_list = list(community_sets.values())
+        return PartitionModularity.from_graph(graph, communities).modularity
+    
+    @staticmethod
+    def breakdown(graph: nx.Graph, communities: Dict[Hashable, int]) -> Dict[str, Any]:
+        """Calculate weighted modularity and each community's share of it.
         
-        # Calculate modularity using NetworkX
-        modularity = nx.community.modularity(graph, community_list, weight='weight')
+        Args:
+            graph: NetworkX graph with weighted edges
+            communities: Node to community ID mapping
         
-        return modularity
+        Returns:
+            Dictionary with modularity and contributions (community ID →
+            in(c) / 2m - (tot(c) / 2m)², summing to Q)
+        """
+        return PartitionModularity.from_graph(graph, communities).breakdown()
     
     @staticmethod
     def interpret_modularity(modularity: float) -> Dict[str, any]:
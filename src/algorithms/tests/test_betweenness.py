@@ -0,0 +1,177 @@
+"""Tests for the native (and process-pool) Brandes betweenness"""
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from src.algorithms.betweenness import BetweennessCentrality, IncrementalBetweenness
+from src.graph.csr_graph import CSRGraph
+from tests.fixtures.sample_graphs import planted_graph
+
+
+def graphs():
+    """Weighted test graphs, including a self-loop and a separate component."""
+    extra = nx.Graph()
+    extra.add_weighted_edges_from([("a", "a", 2), ("a", "b", 1), ("b", "c", 3), ("d", "e", 1)])
+    return [planted_graph(groups=4), nx.karate_club_graph(), extra]
+
+
+def with_lengths(graph: nx.Graph, distance: str) -> nx.Graph:
+    """Copy of graph with a "length" attribute per CSRGraph distance mode."""
+    graph = graph.copy()
+    total = sum(w for _, _, w in graph.edges(data="weight", default=1))
+    for u, v, data in graph.edges(data=True):
+        w = data.get("weight", 1)
+        data["length"] = {"raw": w, "inverse": 1 / w, "neg_log": -np.log(w / total)}[distance]
+    return graph
+
+
+@pytest.mark.parametrize("weighted", [True, False])
+@pytest.mark.parametrize("normalized", [True, False])
+@pytest.mark.parametrize("distance", ["raw", "inverse", "neg_log"])
+def test_matches_networkx(weighted, normalized, distance):
+    """Test values equal nx.betweenness_centrality on the same lengths."""
+    for graph in graphs():
+        expected = nx.betweenness_centrality(
+            with_lengths(graph, distance), weight="length" if weighted else None,
+            normalized=normalized
+        )
+        bc = BetweennessCentrality.calculate(graph, weighted, normalized, distance=distance)
+
+        assert bc.keys() == expected.keys()
+        for node, value in expected.items():
+            assert bc[node] == pytest.approx(value, rel=1e-12, abs=1e-15)
+
+
+def test_strong_links_are_short():
+    """Test the default distance routes through the strongest links."""
+    graph = nx.Graph()
+    graph.add_weighted_edges_from([("a", "b", 9), ("b", "c", 9), ("a", "c", 1)])
+
+    assert BetweennessCentrality.calculate(graph)["b"] > 0
+    assert BetweennessCentrality.calculate(graph, distance="raw")["b"] == 0
+
+
+def test_unknown_distance_mode():
+    """Test an unknown distance transform is rejected."""
+    with pytest.raises(ValueError):
+        BetweennessCentrality.calculate(nx.karate_club_graph(), distance="log")
+
+
+def test_process_pool_matches_single_process():
+    """Test chunked pool results match the in-process computation."""
+    csr = CSRGraph.from_networkx(planted_graph())
+
+    single = BetweennessCentrality.calculate_csr(csr, n_jobs=1)
+    pooled = BetweennessCentrality.calculate_csr(csr, n_jobs=2)
+
+    assert pooled == pytest.approx(single, rel=1e-12, abs=1e-15)
+
+
+def test_invalid_n_jobs():
+    """Test n_jobs below 1 is rejected."""
+    with pytest.raises(ValueError):
+        BetweennessCentrality.calculate(nx.karate_club_graph(), n_jobs=0)
+
+
+def test_approximate_with_all_sources_is_exact():
+    """Test sampling every source gives the exact values and zero error."""
+    graph = nx.karate_club_graph()
+    result = BetweennessCentrality.calculate_approximate(graph, k=len(graph))
+
+    assert result["samples"] == len(graph)
+    assert result["error"] == 0.0
+    for node, value in BetweennessCentrality.calculate(graph).items():
+        assert result["betweenness"][node] == pytest.approx(value, rel=1e-12, abs=1e-15)
+
+
+def test_approximate_error_covers_actual_error():
+    """Test the reported error bounds the actual deviation for fixed k."""
+    graph = nx.barabasi_albert_graph(300, 2, seed=1)
+    exact = BetweennessCentrality.calculate(graph, weighted=False)
+
+    result = BetweennessCentrality.calculate_approximate(graph, k=60, weighted=False)
+
+    assert result["samples"] == 60
+    assert 0 < result["error"] < 1
+    assert max(abs(result["betweenness"][v] - exact[v]) for v in graph) <= result["error"]
+
+
+def test_adaptive_sampling_stops_at_target_error():
+    """Test adaptive mode stops once the error estimate reaches epsilon."""
+    graph = nx.barabasi_albert_graph(300, 2, seed=1)
+    result = BetweennessCentrality.calculate_approximate(graph, epsilon=0.05, weighted=False)
+
+    assert result["error"] <= 0.05
+    assert result["samples"] < len(graph)
+
+
+def test_approximate_is_reproducible():
+    """Test the same seed samples the same sources."""
+    graph = planted_graph(groups=4)
+    first = BetweennessCentrality.calculate_approximate(graph, k=20, random_state=7)
+    second = BetweennessCentrality.calculate_approximate(graph, k=20, random_state=7)
+
+    assert first == second
+
+
+def test_approximate_invalid_parameters():
+    """Test out-of-range sampling parameters are rejected."""
+    graph = nx.karate_club_graph()
+    with pytest.raises(ValueError):
+        BetweennessCentrality.calculate_approximate(graph, k=0)
+    with pytest.raises(ValueError):
+        BetweennessCentrality.calculate_approximate(graph, delta=1.5)
+
+
+def assert_matches_exact(bc: dict, graph: nx.Graph, weighted: bool = True):
+    """Assert values equal a from-scratch computation on graph."""
+    expected = BetweennessCentrality.calculate(graph, weighted)
+    assert bc.keys() == expected.keys()
+    for node, value in expected.items():
+        assert bc[node] == pytest.approx(value, rel=1e-9, abs=1e-12)
+
+
+@pytest.mark.parametrize("weighted", [True, False])
+def test_incremental_matches_full_recomputation(weighted):
+    """Test updates after weight changes, new edges and new nodes stay exact."""
+    graph = planted_graph(groups=4)
+    incremental = IncrementalBetweenness(weighted=weighted)
+    incremental.fit(graph)
+
+    graph[0][next(iter(graph[0]))]["weight"] += 4
+    assert_matches_exact(incremental.update(graph), graph, weighted)
+
+    graph.add_edge(3, 90, weight=2)
+    graph.add_edge("new", 5, weight=1)
+    assert_matches_exact(incremental.update(graph), graph, weighted)
+
+    graph.remove_edge(3, 90)
+    assert_matches_exact(incremental.update(graph), graph, weighted)
+
+
+def test_incremental_recomputes_only_affected_sources():
+    """Test an edge off every shortest path recomputes nothing."""
+    graph = nx.Graph()
+    graph.add_weighted_edges_from([("a", "b", 5), ("b", "c", 5), ("a", "c", 1), ("c", "d", 1)])
+    incremental = IncrementalBetweenness()
+    incremental.fit(graph)
+
+    graph["a"]["c"]["weight"] = 2
+    assert_matches_exact(incremental.update(graph), graph)
+    assert incremental.recomputed_sources == 0
+
+    graph["a"]["c"]["weight"] = 10
+    assert_matches_exact(incremental.update(graph), graph)
+    assert 0 < incremental.recomputed_sources <= len(graph)
+
+
+def test_incremental_removed_node_recomputes():
+    """Test removing a node falls back to a full recomputation."""
+    graph = nx.karate_club_graph()
+    incremental = IncrementalBetweenness()
+    incremental.fit(graph)
+
+    graph.remove_node(0)
+    assert_matches_exact(incremental.update(graph), graph)
+    assert incremental.recomputed_sources == len(graph)
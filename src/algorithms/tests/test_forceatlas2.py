@@ -0,0 +1,211 @@
+"""Tests for the native ForceAtlas2 engine"""
+
+import warnings
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from src.algorithms.forceatlas2 import (
+    ForceAtlas2Layout, _barnes_hut_repulsion, _heavy_edge_matching
+)
+from src.graph.csr_graph import CSRGraph
+from tests.fixtures.sample_graphs import planted_graph
+
+
+def community_spread(graph, positions) -> float:
+    """Mean distance within planted groups over mean distance across them."""
+    labels = {node: k for k, group in enumerate(graph.graph["partition"]) for node in group}
+    nodes = list(graph)
+    points = np.array([positions[node] for node in nodes])
+    groups = np.array([labels[node] for node in nodes])
+
+    distances = np.linalg.norm(points[:, None] - points[None], axis=-1)
+    same = groups[:, None] == groups[None]
+    return distances[same].mean() / distances[~same].mean()
+
+
+def test_repulsion_without_approximation_is_exact():
+    """Test θ = 0 opens every region, matching all-pairs repulsion."""
+    rng = np.random.default_rng(0)
+    x, y = rng.random(300), rng.random(300)
+    mass = 1.0 + rng.integers(0, 5, 300)
+
+    fx, fy = _barnes_hut_repulsion(x, y, mass, 0.0, 20.0)
+
+    dx, dy = x[:, None] - x[None], y[:, None] - y[None]
+    d2 = dx ** 2 + dy ** 2
+    np.fill_diagonal(d2, np.inf)
+    factor = 20.0 * mass[:, None] * mass[None] / d2
+    assert np.allclose(fx, (dx * factor).sum(axis=1))
+    assert np.allclose(fy, (dy * factor).sum(axis=1))
+
+
+def test_repulsion_with_coincident_nodes_is_finite():
+    """Test nodes at the same position do not produce infinite forces."""
+    x = np.array([0.0, 0.0, 1.0, 0.5])
+    y = np.array([0.0, 0.0, 1.0, 0.2])
+
+    fx, fy = _barnes_hut_repulsion(x, y, np.ones(4), 1.2, 20.0)
+
+    assert np.all(np.isfinite(fx)) and np.all(np.isfinite(fy))
+
+
+def test_layout_separates_communities():
+    """Test planted communities are laid out as separate clusters."""
+    graph = planted_graph(groups=4)
+    positions = ForceAtlas2Layout().compute_layout(graph, iterations=300)
+
+    assert set(positions) == set(graph)
+    assert community_spread(graph, positions) < 0.5
+
+
+def test_layout_is_reproducible():
+    """Test the same seed gives the same layout, on NetworkX or CSR input."""
+    graph = planted_graph(groups=3)
+    layout = ForceAtlas2Layout(random_state=7)
+
+    first = layout.compute_layout(graph, iterations=50)
+    second = layout.compute_layout(CSRGraph.from_networkx(graph), iterations=50)
+
+    assert first == second
+
+
+def test_stops_early_once_stable():
+    """Test a settled layout stops before the cap and reports its trace."""
+    graph = planted_graph(groups=4)
+    result = ForceAtlas2Layout().compute_layout_with_stats(graph)
+
+    assert result["converged"]
+    assert result["iterations"] < 1000
+    assert len(result["trace"]["swing"]) == result["iterations"]
+    assert len(result["trace"]["displacement"]) == result["iterations"]
+    assert result["trace"]["drift"][-1] < ForceAtlas2Layout.CONVERGENCE_TOLERANCE
+    assert community_spread(graph, result["positions"]) < 0.5
+
+
+def test_zero_tolerance_runs_every_iteration():
+    """Test tolerance 0 disables early stopping."""
+    result = ForceAtlas2Layout(tolerance=0).compute_layout_with_stats(
+        planted_graph(groups=3), iterations=120
+    )
+
+    assert result["iterations"] == 120
+    assert not result["converged"]
+
+
+def test_empty_graph_layout():
+    """Test an empty graph returns at once without running iterations."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = ForceAtlas2Layout().compute_layout_with_stats(nx.Graph())
+
+    assert result["positions"] == {}
+    assert result["iterations"] == 0
+    assert len(result["trace"]["swing"]) == 0
+
+
+def test_seed_positions_places_new_nodes():
+    """Test new nodes start at their placed neighbors' weighted centroid."""
+    graph = nx.Graph()
+    graph.add_edge("a", "new", weight=1)
+    graph.add_edge("b", "new", weight=3)
+    graph.add_edge("new", "chain", weight=1)
+    graph.add_node("isolated")
+    csr = CSRGraph.from_networkx(graph)
+
+    start = ForceAtlas2Layout().seed_positions(csr, {"a": (0.0, 0.0), "b": (4.0, 8.0)})
+    new = start[csr.node_index["new"]]
+    chain = start[csr.node_index["chain"]]
+    isolated = start[csr.node_index["isolated"]]
+
+    assert np.allclose(new, (3.0, 6.0), atol=0.5)
+    assert np.allclose(chain, new, atol=0.5)
+    assert 0 <= isolated[0] <= 4.1 and 0 <= isolated[1] <= 8.1
+    assert ForceAtlas2Layout().seed_positions(csr, {}) is None
+
+
+def test_warm_start_keeps_mental_map():
+    """Test re-layout after an edit starts from stored x/y and moves little."""
+    graph = planted_graph(groups=4)
+    layout = ForceAtlas2Layout()
+    before = layout.compute_layout(graph)
+    layout.apply_layout_to_graph(graph, before)
+
+    graph.add_edge(0, "new", weight=3)
+    graph.add_edge(1, "new", weight=2)
+    result = layout.compute_layout_with_stats(graph)
+    after = result["positions"]
+
+    old = np.array([before[node] for node in before])
+    moved = np.array([after[node] for node in before])
+    radius = np.sqrt(np.mean(np.sum((old - old.mean(axis=0)) ** 2, axis=1)))
+    assert result["iterations"] <= ForceAtlas2Layout.REFINE_ITERATIONS
+    assert np.mean(np.linalg.norm(moved - old, axis=1)) < 0.15 * radius
+    assert set(after) == set(graph)
+
+
+def test_heavy_edge_matching_pairs_neighbors():
+    """Test matching groups are single nodes or pairs joined by an edge."""
+    graph = planted_graph(groups=3)
+    csr = CSRGraph.from_networkx(graph)
+    n = csr.number_of_nodes()
+
+    group = _heavy_edge_matching(csr.indptr, csr.indices, csr.weights, np.ones(n), np.arange(n))
+
+    assert np.bincount(group).max() <= 2
+    assert group.max() + 1 < 0.8 * n
+    for members in (np.flatnonzero(group == g) for g in range(group.max() + 1)):
+        if len(members) == 2:
+            assert members[1] in csr.neighbors(members[0])
+
+
+def test_multilevel_layout():
+    """Test multilevel layouts refine every level and keep communities apart."""
+    graph = planted_graph(groups=6)
+    for coarsening in ForceAtlas2Layout.COARSENINGS:
+        layout = ForceAtlas2Layout(coarsening=coarsening)
+        layout.COARSEST_NODES = 40
+        result = layout.compute_layout_with_stats(graph)
+
+        levels = result["levels"]
+        assert len(levels) > 1
+        assert levels[-1]["nodes"] == graph.number_of_nodes()
+        assert levels[0]["nodes"] < levels[-1]["nodes"]
+        assert all(level["iterations"] <= ForceAtlas2Layout.LEVEL_ITERATIONS
+                   for level in levels[1:])
+        assert set(result["positions"]) == set(graph)
+        assert community_spread(graph, result["positions"]) < 0.5
+
+
+def test_multilevel_coarsest_cap_follows_coarse_size():
+    """Test the coarsest level's cap comes from its node count, not the input's."""
+    graph = planted_graph(groups=24)
+    layout = ForceAtlas2Layout(coarsening="matching", tolerance=0)
+    layout.COARSEST_NODES = 40
+    levels = layout.compute_layout_with_stats(graph)["levels"]
+
+    assert graph.number_of_nodes() >= 500
+    assert levels[0]["iterations"] == layout.default_iterations(levels[0]["nodes"]) == 1000
+
+
+def test_multilevel_options_validated():
+    """Test unknown coarsenings and multilevel fa2 are rejected."""
+    with pytest.raises(ValueError):
+        ForceAtlas2Layout(coarsening="metis")
+    with pytest.raises(ValueError):
+        ForceAtlas2Layout(engine="fa2", coarsening="matching")
+
+
+def test_default_iterations():
+    """Test iteration counts follow the node-count thresholds."""
+    layout = ForceAtlas2Layout()
+
+    assert layout.default_iterations(499) == 1000
+    assert layout.default_iterations(500) == 2000
+
+
+def test_unknown_engine():
+    """Test an unknown engine is rejected."""
+    with pytest.raises(ValueError):
+        ForceAtlas2Layout(engine="gpu")
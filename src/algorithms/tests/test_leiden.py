@@ -0,0 +1,70 @@
+"""Tests for the Leiden community detection"""
+
+import networkx as nx
+
+from src.algorithms.leiden import LeidenCommunityDetection
+from src.algorithms.louvain import LouvainCommunityDetection
+from src.graph.csr_graph import CSRGraph
+from tests.fixtures.sample_graphs import planted_graph
+
+
+def members(partition: dict) -> dict:
+    """Group nodes by community ID."""
+    groups = {}
+    for node, community in partition.items():
+        groups.setdefault(community, []).append(node)
+    return groups
+
+
+def test_quality_matches_louvain():
+    """Test Leiden partitions are at least as good as Louvain's."""
+    for graph in (planted_graph(), nx.karate_club_graph()):
+        leiden = LeidenCommunityDetection()
+        louvain = LouvainCommunityDetection()
+
+        leiden_q = leiden.get_modularity(graph, leiden.detect_communities(graph))
+        louvain_q = louvain.get_modularity(graph, louvain.detect_communities(graph))
+
+        assert leiden_q >= louvain_q - 0.01
+
+
+def test_communities_are_connected():
+    """Test refinement never leaves a community disconnected."""
+    graph = nx.connected_caveman_graph(12, 6)
+    graph.add_edges_from(nx.gnm_random_graph(72, 60, seed=1).edges())
+
+    for seed in range(5):
+        partition = LeidenCommunityDetection(random_state=seed).detect_communities(graph)
+        for nodes in members(partition).values():
+            assert nx.is_connected(graph.subgraph(nodes))
+
+
+def test_recovers_planted_communities():
+    """Test clearly separated groups are found exactly."""
+    graph = planted_graph()
+    partition = LeidenCommunityDetection().detect_communities(graph)
+
+    for group in graph.graph["partition"]:
+        assert len({partition[node] for node in group}) == 1
+    assert len(set(partition.values())) == len(graph.graph["partition"])
+
+
+def test_fixed_seed_is_reproducible():
+    """Test the same seed gives the same partition, on NetworkX or CSR input."""
+    graph = planted_graph(seed=5)
+    detector = LeidenCommunityDetection(random_state=42)
+
+    assert detector.detect_communities(graph) == \
+        detector.detect_communities(CSRGraph.from_networkx(graph))
+
+
+def test_warm_start_keeps_ids():
+    """Test a warm start after a small edit keeps community IDs."""
+    graph = planted_graph()
+    detector = LeidenCommunityDetection()
+    previous = detector.detect_communities(graph)
+
+    graph.add_edge(0, 1, weight=3)
+    partition = detector.detect_communities(graph, previous, changed_nodes=[0, 1])
+
+    assert partition == previous
@@ -0,0 +1,99 @@
+"""Tests for the native CSR Louvain engine"""
+
+import networkx as nx
+import pytest
+
+from src.algorithms.louvain import LouvainCommunityDetection
+from src.graph.csr_graph import CSRGraph
+from tests.fixtures.sample_graphs import planted_graph
+
+
+def test_native_matches_python_louvain_quality():
+    """Test native partitions are as good as python-louvain's."""
+    for graph in (planted_graph(), nx.karate_club_graph()):
+        native = LouvainCommunityDetection()
+        reference = LouvainCommunityDetection(engine="python-louvain")
+
+        native_q = native.get_modularity(graph, native.detect_communities(graph))
+        reference_q = reference.get_modularity(graph, reference.detect_communities(graph))
+
+        assert native_q >= reference_q - 0.01
+
+
+def test_recovers_planted_communities():
+    """Test clearly separated groups are found exactly."""
+    graph = planted_graph()
+    partition = LouvainCommunityDetection().detect_communities(graph)
+
+    for group in graph.graph["partition"]:
+        assert len({partition[node] for node in group}) == 1
+    assert len(set(partition.values())) == len(graph.graph["partition"])
+
+
+def test_fixed_seed_is_reproducible():
+    """Test the same seed gives the same partition, on NetworkX or CSR input."""
+    graph = planted_graph(seed=5)
+    detector = LouvainCommunityDetection(random_state=42)
+
+    first = detector.detect_communities(graph)
+    second = detector.detect_communities(CSRGraph.from_networkx(graph))
+
+    assert first == second
+
+
+def test_community_ids_numbered_by_first_node():
+    """Test community IDs are 0..k-1 in node order of first appearance."""
+    partition = LouvainCommunityDetection().detect_communities(planted_graph())
+
+    seen = []
+    for community in partition.values():
+        if community not in seen:
+            seen.append(community)
+    assert seen == list(range(len(seen)))
+
+
+def test_graph_without_edges():
+    """Test isolated nodes each form their own community."""
+    graph = nx.Graph()
+    graph.add_nodes_from(["a", "b"])
+
+    assert LouvainCommunityDetection().detect_communities(graph) == {"a": 0, "b": 1}
+
+
+def test_unknown_engine_rejected():
+    """Test unknown engines raise."""
+    with pytest.raises(ValueError):
+        LouvainCommunityDetection(engine="leiden")
+
+
+def test_warm_start_after_small_edit():
+    """Test a warm start keeps quality and community IDs after an edit."""
+    graph = planted_graph(seed=7)
+    detector = LouvainCommunityDetection()
+    previous = detector.detect_communities(graph)
+
+    # Append a "statement" linking a node of group 0 to a new node
+    graph.add_edge(0, "new", weight=3)
+    graph.add_edge(1, "new", weight=2)
+
+    warm = detector.detect_communities(graph, previous_partition=previous,
+                                       changed_nodes=[0, 1, "new"])
+    cold = detector.detect_communities(graph)
+
+    assert detector.get_modularity(graph, warm) >= detector.get_modularity(graph, cold) - 0.01
+    assert warm["new"] == warm[0] == previous[0]
+    unchanged = sum(warm[node] == previous[node] for node in previous)
+    assert unchanged == len(previous)
+
+
+def test_ids_stable_across_runs():
+    """Test community IDs are matched to the previous partition's IDs."""
+    graph = planted_graph(seed=9)
+    detected = LouvainCommunityDetection().detect_communities(graph)
+    previous = {node: 100 + community for node, community in detected.items()}
+
+    for engine in LouvainCommunityDetection.ENGINES:
+        partition = LouvainCommunityDetection(engine=engine).detect_communities(
+            graph, previous_partition=previous
+        )
+        assert partition == previous
@@ -0,0 +1,82 @@
+"""Tests for the array-based modularity engine"""
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from src.algorithms.louvain import LouvainCommunityDetection
+from src.algorithms.modularity import ModularityCalculator, PartitionModularity
+from tests.fixtures.sample_graphs import planted_graph
+
+
+def reference_modularity(graph, partition, resolution=1.0) -> float:
+    """NetworkX modularity of a node → community mapping."""
+    groups = {}
+    for node, community in partition.items():
+        groups.setdefault(community, set()).add(node)
+    return nx.community.modularity(graph, groups.values(), weight="weight",
+                                   resolution=resolution)
+
+
+def test_matches_networkx():
+    """Test Q equals NetworkX's for detected and arbitrary partitions."""
+    graph = planted_graph()
+    graph.add_edge(0, 0, weight=4)
+    rng = np.random.default_rng(0)
+    partitions = [
+        LouvainCommunityDetection().detect_communities(graph),
+        {node: int(rng.integers(0, 5)) for node in graph},
+    ]
+
+    for partition in partitions:
+        for resolution in (0.5, 1.0):
+            expected = reference_modularity(graph, partition, resolution)
+            modularity = PartitionModularity.from_graph(graph, partition, resolution).modularity
+            assert modularity == pytest.approx(expected)
+        assert ModularityCalculator.calculate(graph, partition) == \
+            pytest.approx(reference_modularity(graph, partition))
+
+
+def test_contributions_sum_to_modularity():
+    """Test the breakdown is keyed by community ID and sums to Q."""
+    graph = nx.karate_club_graph()
+    partition = {node: f"c{club == 'Officer'}" for node, club in graph.nodes(data="club")}
+
+    breakdown = ModularityCalculator.breakdown(graph, partition)
+
+    assert set(breakdown["contributions"]) == {"cTrue", "cFalse"}
+    assert sum(breakdown["contributions"].values()) == pytest.approx(breakdown["modularity"])
+    assert breakdown["modularity"] == pytest.approx(reference_modularity(graph, partition))
+
+
+def test_delta_matches_recomputation():
+    """Test ΔQ of moving a node equals the change in recomputed Q."""
+    graph = planted_graph(groups=4)
+    graph.add_edge(3, 3, weight=2)
+    partition = LouvainCommunityDetection().detect_communities(graph)
+    engine = PartitionModularity.from_graph(graph, partition)
+    label = {community: i for i, community in enumerate(engine.community_ids)}
+    new_label = len(engine.community_ids)
+
+    for node in (0, 3, 50, 99):
+        for target in (0, 2, new_label):
+            moved = dict(partition)
+            moved[node] = engine.community_ids[target] if target < new_label else "new"
+            expected = reference_modularity(graph, moved) - reference_modularity(graph, partition)
+            assert engine.delta(node, target) == pytest.approx(expected, abs=1e-12)
+        assert engine.delta(node, label[partition[node]]) == 0.0
+
+
+def test_missing_node_rejected():
+    """Test partitions must cover every node."""
+    graph = nx.path_graph(3)
+    with pytest.raises(ValueError):
+        ModularityCalculator.calculate(graph, {0: 0, 1: 0})
+
+
+def test_graph_without_edges():
+    """Test modularity is 0 when there are no edges."""
+    graph = nx.Graph()
+    graph.add_nodes_from(["a", "b"])
+
+    assert ModularityCalculator.calculate(graph, {"a": 0, "b": 1}) == 0.0
@@ -8,6 +8,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 
+from src.nlp.text_processor import TextProcessor
+
 app = FastAPI(
     title="Synthesis API",
     description="Text-to-Knowledge-Graph System with AI Insights",
@@ -24,6 +26,12 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def warm_up_models():
+    """Load spaCy pipelines once per worker, before the first request."""
+    TextProcessor().warm_up()
+
+
 # Request/Response models
 class TextProcessRequest(BaseModel):
     text: str
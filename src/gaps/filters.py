@@ -6,8 +6,12 @@ Five-stage filtering system:
 3. Density filters
 4. Gap score calculation
 5. Semantic validation
+
+size_mask and density_filter also take arrays, so a whole batch of
+candidate community pairs is filtered at once.
 """
 
+import numpy as np
 from typing import Set
 
 
@@ -43,6 +47,25 @@ class GapFilters:
         
         return True
     
+    @staticmethod
+    def size_mask(sizes_a: np.ndarray, sizes_b: np.ndarray,
+                  min_size: int = 3,
+                  max_ratio: int = 10) -> np.ndarray:
+        """Vectorized size_filter over arrays of community sizes.
+        
+        Args:
+            sizes_a: Size of the first community of each pair
+            sizes_b: Size of the second community of each pair
+            min_size: Minimum community size
+            max_ratio: Maximum size ratio
+        
+        Returns:
+            Boolean mask, True where the pair passes
+        """
+        smaller = np.minimum(sizes_a, sizes_b)
+        larger = np.maximum(sizes_a, sizes_b)
+        return (smaller >= min_size) & (larger <= max_ratio * smaller)
+    
     @staticmethod
     def distance_filter(path_length: float, 
                        min_hops: int = 2, 
@@ -67,11 +90,12 @@ class GapFilters:
         """Filter by density.
         
         Args:
-            density: Connection density between communities
+            density: Connection density between communities (or an array)
             threshold: Maximum allowed density (default: 0.1 = 10%)
         
         Returns:
-            True if passes filter (density below threshold)
+            True if passes filter (density below threshold), elementwise
+            for arrays
         """
         return density < threshold
     
@@ -2,15 +2,37 @@
 
 Five-stage filtering process with exact thresholds:
 - MIN_COMMUNITY_SIZE: 3 nodes
+- MIN_PATH_LENGTH: 2 hops
 - MAX_PATH_LENGTH: 6 hops
 - DENSITY_THRESHOLD: 0.1 (10%)
 - MAX_SIZE_RATIO: 10:1
 - MIN_GAP_SCORE: 0.4
 - MAX_GAPS_RETURNED: 3
+
+Community distances come from one multi-source BFS per community over a
+CSR view of the graph, stopped after MAX_PATH_LENGTH hops: the level at
+which the search first reaches another community is the shortest path
+between any of their nodes. All community pairs cost O(C·(V+E)) instead
+of a BFS per node pair. Each community is searched at most once, when a
+pair involving it first reaches the distance stage.
+
+Inter-community edge counts and weights come from the contracted
+community graph: one pass over the edge list fills C×C matrices, so
+density (and distance 1 for adjacent communities) is a lookup instead of
+|A|·|B| has_edge calls.
+
+The stages run on arrays of candidate pairs: size, density and adjacency
+masks first, then distance searches only for the survivors in order of
+their best possible score, until no remaining pair can enter the top
+MAX_GAPS_RETURNED.
 """
 
 import networkx as nx
-from typing import List, Dict, Tuple, Any
+import numpy as np
+from collections import Counter
+from typing import List, Dict, Any, Optional, Tuple
+
+from ..graph.csr_graph import CSRGraph
 from .filters import GapFilters
 
 
@@ -19,6 +41,7 @@ class GapDetector:
     
     # Exact thresholds from specifications
     MIN_COMMUNITY_SIZE = 3
+    MIN_PATH_LENGTH = 2
     MAX_PATH_LENGTH = 6
     DENSITY_THRESHOLD = 0.1
     MAX_SIZE_RATIO = 10
@@ -35,106 +58,218 @@ class GapDetector:
         self.graph = graph
         self.communities = communities
         self.filters = GapFilters()
+        self._csr: CSRGraph
+        self._labels: np.ndarray
+        self._label_of: Dict[Any, int] = {}
+        self._distance_rows: Dict[Any, np.ndarray] = {}
+        self._contracted: Optional[Dict[str, Any]] = None
+        self._index_graph()
     
     def detect_gaps(self) -> List[Dict[str, Any]]:
         """Detect gaps using five-stage filtering process.
         
+        Candidate pairs are arrays. Cheap stages (size, density,
+        adjacency) mask all pairs at once. The rest are visited in order
+        of their best possible score, and the search stops once that bound
+        cannot change the top MAX_GAPS_RETURNED.
+        
         Returns:
             List of gap dictionaries (max 3), sorted by gap score
         """
-        # Get community pairs
         community_sets = self._get_community_sets()
-        community_pairs = self._get_community_pairs(community_sets)
+        contracted = self.contracted_graph()
+        ids = contracted["community_ids"]
+        sizes = contracted["sizes"]
+        first, second = np.triu_indices(len(ids), k=1)
+        
+        # Stage 1: Size filters (vectorized, before anything else)
+        keep = self.filters.size_mask(sizes[first], sizes[second],
+                                      self.MIN_COMMUNITY_SIZE, self.MAX_SIZE_RATIO)
+        
+        # Stage 3: Density filter, read from the contracted graph; it is
+        # O(1) per pair so it runs ahead of the distance search
+        edge_counts = contracted["edge_counts"][first, second]
+        density = edge_counts / (sizes[first] * sizes[second])
+        keep &= self.filters.density_filter(density, self.DENSITY_THRESHOLD)
+        
+        # Stage 2 (adjacent pairs): one hop apart, below MIN_PATH_LENGTH
+        if self.MIN_PATH_LENGTH > 1:
+            keep &= edge_counts == 0
         
-        gaps = []
+        # Stage 4 bound: the score can be at most (1 - density) / MIN_PATH_LENGTH
+        bound = (1 - density) * (1 / self.MIN_PATH_LENGTH)
+        keep &= bound >= self.MIN_GAP_SCORE
         
-        for comm_a_id, comm_b_id in community_pairs:
+        # Visit by best possible score, then in pair order (the order ties
+        # are kept in); remaining_first[k] = earliest pair not yet visited
+        candidates = np.flatnonzero(keep)
+        candidates = candidates[np.lexsort((candidates, -bound[candidates]))]
+        remaining_first = np.minimum.accumulate(candidates[::-1])[::-1]
+        
+        top: List[Tuple[float, int, Dict[str, Any]]] = []
+        for position, pair in enumerate(candidates.tolist()):
+            if len(top) == self.MAX_GAPS_RETURNED:
+                worst_score, worst_pair = top[-1][0], top[-1][1]
+                if bound[pair] < worst_score or (bound[pair] == worst_score and
+                                                 worst_pair < remaining_first[position]):
+                    break
+            
+            comm_a_id, comm_b_id = ids[first[pair]], ids[second[pair]]
             comm_a = community_sets[comm_a_id]
             comm_b = community_sets[comm_b_id]
             
-            # Stage 1: Size filters
-            if not self.filters.size_filter(comm_a, comm_b, 
-                                            self.MIN_COMMUNITY_SIZE, 
-                                            self.MAX_SIZE_RATIO):
-                continue
-            
             # Stage 2: Distance filters
-            path_length = self._get_shortest_path_length(comm_a, comm_b)
-            if not self.filters.distance_filter(path_length, 2, self.MAX_PATH_LENGTH):
-                continue
-            
-            # Stage 3: Density filter
-            density = self._calculate_density(comm_a, comm_b)
-            if not self.filters.density_filter(density, self.DENSITY_THRESHOLD):
+            path_length = self._get_shortest_path_length(comm_a_id, comm_b_id)
+            if not self.filters.distance_filter(path_length, self.MIN_PATH_LENGTH,
+                                                self.MAX_PATH_LENGTH):
                 continue
             
             # Stage 4: Gap score calculation
-            gap_score = self._calculate_gap_score(comm_a, comm_b, path_length, density)
+            pair_density = float(density[pair])
+            gap_score = self._calculate_gap_score(comm_a, comm_b, path_length, pair_density)
             if gap_score < self.MIN_GAP_SCORE:
                 continue
             
             # Stage 5: Semantic validation (simplified for now)
             # TODO: Implement semantic validation
             
-            gaps.append({
+            top.append((gap_score, pair, {
                 "community_a_id": comm_a_id,
                 "community_b_id": comm_b_id,
                 "community_a_nodes": list(comm_a),
                 "community_b_nodes": list(comm_b),
                 "gap_score": gap_score,
                 "path_length": path_length,
-                "density": density,
+                "density": pair_density,
                 "size_a": len(comm_a),
                 "size_b": len(comm_b)
-            })
+            }))
+            # Keep the top 3 by gap score (descending), ties in pair order
+            top.sort(key=lambda entry: (-entry[0], entry[1]))
+            del top[self.MAX_GAPS_RETURNED:]
         
-        # Sort by gap score (descending) and return top 3
-        gaps.sort(key=lambda x: x['gap_score'], reverse=True)
-        return gaps[:self.MAX_GAPS_RETURNED]
+        return [gap for _, _, gap in top]
     
     def _get_community_sets(self) -> Dict[int, set]:
         """Convert communities dict to sets."""
-        community_sets = {}
+        community_sets: Dict[int, set] = {}
         for node, comm_id in self.communities.items():
             if comm_id not in community_sets:
                 community_sets[comm_id] = set()
             community_sets[comm_id].add(node)
         return community_sets
     
-    def _get_community_pairs(self, community_sets: Dict[int, set]) -> List[Tuple[int, int]]:
-        """Get all pairs of communities."""
-        comm_ids = list(community_sets.keys())
-        pairs = []
-        for i in range(len(comm_ids)):
-            for j in range(i + 1, len(comm_ids)):
-                pairs.append((comm_ids[i], comm_ids[j]))
-        return pairs
+    def _get_shortest_path_length(self, comm_a_id: int, comm_b_id: int) -> int:
+        """Get shortest path (hops) between two communities.
+        
+        Returns:
+            Fewest hops between any node of A and any node of B, or -1 if
+            there is no path of at most MAX_PATH_LENGTH hops
+        """
+        contracted = self.contracted_graph()
+        if contracted["edge_counts"][self._label_of[comm_a_id], self._label_of[comm_b_id]] > 0:
+            return 1
+        
+        if comm_b_id in self._distance_rows and comm_a_id not in self._distance_rows:
+            comm_a_id, comm_b_id = comm_b_id, comm_a_id
+        row = self._community_distances(comm_a_id)
+        return int(row[self._label_of[comm_b_id]])
     
-    def _get_shortest_path_length(self, comm_a: set, comm_b: set) -> float:
-        """Get shortest path between two communities."""
-        min_path = float('inf')
-        
-        for node_a in comm_a:
-            for node_b in comm_b:
-                try:
-                    path_length = nx.shortest_path_length(self.graph, node_a, node_b)
-                    min_path = min(min_path, path_length)
-                except nx.NetworkXNoPath:
-                    continue
-        
-        return min_path if min_path != float('inf') else -1
+    def _community_distances(self, comm_id: int) -> np.ndarray:
+        """Hops from a community to every community (-1 beyond MAX_PATH_LENGTH).
+        
+        One BFS from all of the community's nodes at once, expanding a
+        whole frontier per step; a community's distance is the level at
+        which any of its nodes is first reached.
+        """
+        row = self._distance_rows.get(comm_id)
+        if row is not None:
+            return row
+        
+        indptr, indices, labels = self._csr.indptr, self._csr.indices, self._labels
+        
+        hops = np.full(len(labels), -1, dtype=np.int64)
+        frontier = np.flatnonzero(labels == self._label_of[comm_id])
+        hops[frontier] = 0
+        for level in range(1, self.MAX_PATH_LENGTH + 1):
+            if len(frontier) == 0:
+                break
+            # Gather every frontier row of the CSR in one indexed read
+            starts = indptr[frontier]
+            counts = indptr[frontier + 1] - starts
+            offsets = np.repeat(starts - np.cumsum(counts) + counts, counts) + \
+                np.arange(counts.sum())
+            neighbors = indices[offsets]
+            frontier = np.unique(neighbors[hops[neighbors] < 0])
+            hops[frontier] = level
+        
+        reached = (hops >= 0) & (labels >= 0)
+        nearest = np.full(len(self._label_of), np.iinfo(np.int64).max)
+        np.minimum.at(nearest, labels[reached], hops[reached])
+        row = np.where(nearest == np.iinfo(np.int64).max, -1, nearest)
+        self._distance_rows[comm_id] = row
+        return row
     
-    def _calculate_density(self, comm_a: set, comm_b: set) -> float:
-        """Calculate density of connections between communities."""
-        actual_edges = 0
-        possible_edges = len(comm_a) * len(comm_b)
+    def contracted_graph(self) -> Dict[str, Any]:
+        """Community graph: edge counts and weights between every community pair.
         
-        for node_a in comm_a:
-            for node_b in comm_b:
-                if self.graph.has_edge(node_a, node_b):
-                    actual_edges += 1
+        Built in one pass over the edge list; matrices are symmetric, the
+        diagonal holds edges inside a community (nodes without a community
+        are skipped).
         
-        return actual_edges / possible_edges if possible_edges > 0 else 0
+        Returns:
+            Dictionary with community_ids (row/column order), sizes (nodes
+            the partition assigns to each community, as in size_a/size_b),
+            edge_counts and edge_weights (C×C arrays)
+        """
+        if self._contracted is not None:
+            return self._contracted
+        
+        size = len(self._label_of)
+        sources, targets, weights = self._csr.edges()
+        source_labels = self._labels[sources]
+        target_labels = self._labels[targets]
+        known = (source_labels >= 0) & (target_labels >= 0)
+        source_labels, target_labels = source_labels[known], target_labels[known]
+        weights = weights[known]
+        
+        # Each undirected edge counts once in both (a, b) and (b, a)
+        mirror = source_labels != target_labels
+        cells = np.concatenate((source_labels * size + target_labels,
+                                (target_labels * size + source_labels)[mirror]))
+        values = np.concatenate((weights, weights[mirror]))
+        community_sizes = Counter(self.communities.values())
+        self._contracted = {
+            "community_ids": list(self._label_of),
+            "sizes": np.array([community_sizes[community] for community in self._label_of],
+                              dtype=np.int64),
+            "edge_counts": np.bincount(cells, minlength=size * size).reshape(size, size),
+            "edge_weights": np.bincount(cells, weights=values,
+                                        minlength=size * size).reshape(size, size),
+        }
+        return self._contracted
+    
+    def _index_graph(self) -> None:
+        """Build the CSR view and the community label per node ID."""
+        self._csr = CSRGraph.from_networkx(self.graph)
+        labels = np.full(self._csr.number_of_nodes(), -1, dtype=np.int64)
+        for node, community in self.communities.items():
+            i = self._csr.node_index.get(node)
+            if i is not None:
+                labels[i] = self._label_of.setdefault(community, len(self._label_of))
+        self._labels = labels
+    
+    def _calculate_density(self, comm_a_id: int, comm_b_id: int) -> float:
+        """Calculate density of connections between communities.
+        
+        Edges between A and B over |A|·|B| possible pairs, read from the
+        contracted community graph.
+        """
+        contracted = self.contracted_graph()
+        a, b = self._label_of[comm_a_id], self._label_of[comm_b_id]
+        possible_edges = contracted["sizes"][a] * contracted["sizes"][b]
+        actual_edges = contracted["edge_counts"][a, b]
+        return float(actual_edges / possible_edges) if possible_edges > 0 else 0
     
     def _calculate_gap_score(self, comm_a: set, comm_b: set, 
                             path_length: float, density: float) -> float:
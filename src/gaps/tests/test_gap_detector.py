@@ -0,0 +1,134 @@
+"""Tests for community distances in gap detection"""
+
+from itertools import combinations
+
+import networkx as nx
+import numpy as np
+
+from src.gaps.filters import GapFilters
+from src.gaps.gap_detector import GapDetector
+
+
+def community_graph(seed: int = 0):
+    """Sparse random communities, a long chain and a detached component."""
+    rng = np.random.default_rng(seed)
+    graph = nx.gnm_random_graph(120, 150, seed=seed)
+    communities = {node: int(rng.integers(0, 12)) for node in graph}
+
+    # Chain of 9 hops from node 0 to a community of its own
+    chain = [0] + [f"chain{i}" for i in range(8)] + ["far"]
+    nx.add_path(graph, chain)
+    communities.update({node: 20 for node in chain[1:-1]})
+    communities["far"] = 21
+
+    graph.add_edge("island_a", "island_b")
+    communities.update({"island_a": 30, "island_b": 30})
+    return graph, communities
+
+
+def reference_distance(graph, comm_a, comm_b, cap) -> int:
+    """Fewest hops between two node sets by pairwise NetworkX searches."""
+    best = min(
+        (nx.shortest_path_length(graph, a, b)
+         for a in comm_a for b in comm_b if nx.has_path(graph, a, b)),
+        default=-1,
+    )
+    return best if best <= cap else -1
+
+
+def test_distances_match_pairwise_shortest_paths():
+    """Test one BFS per community gives every pair's minimum hop count."""
+    graph, communities = community_graph()
+    detector = GapDetector(graph, communities)
+    sets = detector._get_community_sets()
+
+    for comm_a, comm_b in combinations(sets, 2):
+        expected = reference_distance(graph, sets[comm_a], sets[comm_b],
+                                      GapDetector.MAX_PATH_LENGTH)
+        assert detector._get_shortest_path_length(comm_a, comm_b) == expected
+    assert len(detector._distance_rows) < len(sets)
+
+
+def test_distance_beyond_cap_and_disconnected():
+    """Test pairs farther than MAX_PATH_LENGTH or unreachable report -1."""
+    graph, communities = community_graph()
+    detector = GapDetector(graph, communities)
+
+    assert detector._get_shortest_path_length(communities[0], 21) == -1
+    assert detector._get_shortest_path_length(30, communities[0]) == -1
+    assert detector._get_shortest_path_length(20, 21) == 1
+
+
+def test_contracted_graph_matches_pairwise_edges():
+    """Test one-pass community edge counts, weights and densities."""
+    graph, communities = community_graph(seed=3)
+    for u, v in graph.edges():
+        graph[u][v]["weight"] = 2
+    # Sizes count the whole partition, including nodes missing from the graph
+    communities["absent"] = communities[next(iter(graph))]
+    detector = GapDetector(graph, communities)
+    contracted = detector.contracted_graph()
+    sets = detector._get_community_sets()
+    position = {community: i for i, community in enumerate(contracted["community_ids"])}
+    assert [len(sets[community]) for community in position] == contracted["sizes"].tolist()
+
+    for comm_a in sets:
+        for comm_b in sets:
+            # Pairs inside one community see every edge from both ends
+            pairs = sum(graph.has_edge(u, v) for u in sets[comm_a] for v in sets[comm_b])
+            count = pairs if comm_a != comm_b else pairs // 2
+            a, b = position[comm_a], position[comm_b]
+            assert contracted["edge_counts"][a, b] == count
+            assert contracted["edge_weights"][a, b] == 2 * count
+            if comm_a != comm_b:
+                expected = count / (len(sets[comm_a]) * len(sets[comm_b]))
+                assert detector._calculate_density(comm_a, comm_b) == expected
+
+
+def reference_gaps(graph, communities):
+    """Gaps by the per-pair pipeline with pairwise NetworkX searches."""
+    sets = {}
+    for node, community in communities.items():
+        sets.setdefault(community, set()).add(node)
+
+    gaps = []
+    for comm_a, comm_b in combinations(sets, 2):
+        a, b = sets[comm_a], sets[comm_b]
+        small, large = sorted((len(a), len(b)))
+        if small < GapDetector.MIN_COMMUNITY_SIZE or large / small > GapDetector.MAX_SIZE_RATIO:
+            continue
+        path_length = reference_distance(graph, a, b, GapDetector.MAX_PATH_LENGTH)
+        if not 2 <= path_length <= GapDetector.MAX_PATH_LENGTH:
+            continue
+        density = sum(graph.has_edge(u, v) for u in a for v in b) / (len(a) * len(b))
+        if density >= GapDetector.DENSITY_THRESHOLD:
+            continue
+        score = (1 - density) * (1 / path_length)
+        if score >= GapDetector.MIN_GAP_SCORE:
+            gaps.append((score, comm_a, comm_b, path_length))
+    gaps.sort(key=lambda gap: gap[0], reverse=True)
+    return gaps[:GapDetector.MAX_GAPS_RETURNED]
+
+
+def test_pruned_pipeline_matches_pairwise_reference():
+    """Test the pruned array pipeline returns the same gaps, ties included."""
+    for seed in range(4):
+        rng = np.random.default_rng(seed)
+        graph = nx.gnm_random_graph(150, 170, seed=seed)
+        communities = {node: int(rng.integers(0, 40)) for node in graph}
+
+        gaps = GapDetector(graph, communities).detect_gaps()
+
+        assert [(gap["gap_score"], gap["community_a_id"], gap["community_b_id"],
+                 gap["path_length"]) for gap in gaps] == reference_gaps(graph, communities)
+        assert len(gaps) == GapDetector.MAX_GAPS_RETURNED
+
+
+def test_size_mask_matches_size_filter():
+    """Test the vectorized size filter agrees with the per-pair one."""
+    sizes_a, sizes_b = np.meshgrid(np.arange(1, 40), np.arange(1, 40))
+    mask = GapFilters.size_mask(sizes_a.ravel(), sizes_b.ravel())
+
+    expected = [GapFilters.size_filter(set(range(a)), set(range(b)))
+                for a, b in zip(sizes_a.ravel(), sizes_b.ravel())]
+    assert mask.tolist() == expected
@@ -2,7 +2,9 @@
 
 Components:
 - graph_builder: Build NetworkX graph from n-grams
-- edge_calculator: ADDITIVE edge weight calculation (NO normalization)
+- edge_calculator: ADDITIVE edge weight calculation (NO normalization),
+  including a fused token-ID path that skips the n-gram list
+- csr_graph: Compact CSR graph (NumPy arrays) convertible to/from NetworkX
 
 Critical: Edge weights are ADDITIVE without normalization.
 Raw weights used directly in all algorithms.
@@ -10,5 +12,6 @@ Raw weights used directly in all algorithms.
 
 from .graph_builder import GraphBuilder
 from .edge_calculator import EdgeCalculator
+from .csr_graph import CSRGraph
 
-__all__ = ["GraphBuilder", "EdgeCalculator"]
+__all__ = ["GraphBuilder", "EdgeCalculator", "CSRGraph"]
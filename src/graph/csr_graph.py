@@ -0,0 +1,260 @@
+"""Compact CSR Graph
+
+Array-backed alternative to networkx.Graph for large contexts:
+- Node-ID interning: labels ↔ contiguous int IDs
+- CSR adjacency: indptr / indices / weights NumPy arrays
+- Undirected: every edge is stored in both rows (self-loops once)
+- Cheap conversion to and from NetworkX
+- Vectorized aggregation of node groups into a quotient graph
+
+Edge weights are additive co-occurrence strengths; shortest-path
+algorithms read edge lengths from edge_lengths(mode), computed once per
+mode and cached alongside the arrays.
+
+12 bytes per stored edge direction (int32 index + float64 weight) plus
+an 8-byte indptr entry per node, instead of ~1 KB per edge for
+NetworkX's dict-of-dicts; each cached edge_lengths mode adds 8 bytes per
+direction. Rows are contiguous slices that vectorized algorithms can
+consume directly.
+"""
+
+import networkx as nx
+import numpy as np
+from typing import Dict, Hashable, Iterator, List, Sequence, Tuple
+
+
+def aggregate_csr(indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray,
+                  group: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Collapse node groups into single nodes (vectorized quotient graph).
+
+    Internal edges appear in two CSR rows and become one self-loop with
+    their full weight; self-loops (stored once) carry over unchanged.
+
+    Args:
+        indptr: Row pointers, shape (n + 1,)
+        indices: Neighbor IDs aligned with weights
+        weights: Edge weights
+        group: Group ID per node ID, covering 0..k-1
+
+    Returns:
+        (indptr, indices, weights) of the k-node aggregated graph
+    """
+    size = group.max() + 1
+    rows = np.repeat(np.arange(len(group)), np.diff(indptr))
+    new_rows = group[rows]
+    new_cols = group[indices]
+    halve = (new_rows == new_cols) & (rows != indices)
+    values = np.where(halve, weights / 2, weights)
+
+    keys, inverse = np.unique(new_rows * size + new_cols, return_inverse=True)
+    new_weights = np.bincount(inverse.ravel(), weights=values)
+    new_rows, new_indices = keys // size, keys % size
+
+    new_indptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(new_rows, minlength=size), out=new_indptr[1:])
+    return new_indptr, new_indices, new_weights
+
+
+class CSRGraph:
+    """Undirected weighted graph in compressed sparse row form."""
+
+    # Strength → length transforms for shortest paths:
+    # raw: w (weights read as lengths), inverse: 1 / w,
+    # neg_log: -log(w / total weight)
+    DISTANCE_MODES = ("raw", "inverse", "neg_log")
+
+    def __init__(self, nodes: Sequence[Hashable], indptr: np.ndarray,
+                 indices: np.ndarray, weights: np.ndarray):
+        """Initialize from CSR arrays (use the from_* constructors).
+
+        Args:
+            nodes: Node labels, position = node ID
+            indptr: Row pointers, shape (n + 1,)
+            indices: Neighbor IDs, row i is indices[indptr[i]:indptr[i + 1]]
+            weights: Edge weights aligned with indices
+        """
+        self.nodes: List[Hashable] = list(nodes)
+        self.node_index: Dict[Hashable, int] = {node: i for i, node in enumerate(self.nodes)}
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self._edge_lengths: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def from_edges(cls, nodes: Sequence[Hashable], sources: np.ndarray,
+                   targets: np.ndarray, weights: np.ndarray) -> "CSRGraph":
+        """Build from an undirected edge list over node IDs.
+
+        Each undirected edge must appear once (e.g. the edge table from
+        EdgeCalculator.calculate_weights_from_ids).
+
+        Args:
+            nodes: Node labels, position = node ID
+            sources: Edge source IDs
+            targets: Edge target IDs
+            weights: Edge weights
+
+        Returns:
+            CSRGraph
+        """
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        weights = np.asarray(weights, dtype=np.float64)
+
+        # Mirror every non-loop edge so each row lists all its neighbors
+        mirror = sources != targets
+        rows = np.concatenate((sources, targets[mirror]))
+        cols = np.concatenate((targets, sources[mirror]))
+        vals = np.concatenate((weights, weights[mirror]))
+
+        order = np.lexsort((cols, rows))
+        counts = np.bincount(rows, minlength=len(nodes))
+        indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+
+        return cls(nodes, indptr, cols[order], vals[order])
+
+    @classmethod
+    def from_networkx(cls, graph: nx.Graph, weight: str = "weight",
+                      nodes: Sequence[Hashable] = None) -> "CSRGraph":
+        """Convert a NetworkX graph (missing weights default to 1).
+
+        Args:
+            graph: NetworkX graph
+            weight: Edge weight attribute
+            nodes: Optional node order (must list every node of the graph)
+
+        Returns:
+            CSRGraph with nodes in the given or graph.nodes() order
+        """
+        nodes = list(graph.nodes()) if nodes is None else list(nodes)
+        node_index = {node: i for i, node in enumerate(nodes)}
+
+        edge_count = graph.number_of_edges()
+        sources = np.empty(edge_count, dtype=np.int64)
+        targets = np.empty(edge_count, dtype=np.int64)
+        weights = np.empty(edge_count, dtype=np.float64)
+        for k, (u, v, w) in enumerate(graph.edges(data=weight, default=1)):
+            sources[k] = node_index[u]
+            targets[k] = node_index[v]
+            weights[k] = w
+
+        return cls.from_edges(nodes, sources, targets, weights)
+
+    def to_networkx(self, weight: str = "weight") -> nx.Graph:
+        """Convert back to a NetworkX graph.
+
+        Args:
+            weight: Edge weight attribute to write
+
+        Returns:
+            NetworkX graph with the same nodes and weighted edges
+        """
+        graph = nx.Graph()
+        graph.add_nodes_from(self.nodes)
+
+        sources, targets, weights = self.edges()
+        nodes = self.nodes
+        # Integral weights go back as ints, matching GraphBuilder output
+        values = weights.astype(np.int64) if np.all(weights == np.round(weights)) else weights
+        graph.add_weighted_edges_from(
+            ((nodes[u], nodes[v], w)
+             for u, v, w in zip(sources.tolist(), targets.tolist(), values.tolist())),
+            weight=weight
+        )
+        return graph
+
+    def edges(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Undirected edge list, each edge once with source <= target.
+
+        Returns:
+            (sources, targets, weights) arrays
+        """
+        rows = self.row_ids()
+        upper = rows <= self.indices
+        return rows[upper], self.indices[upper], self.weights[upper]
+
+    def edge_lengths(self, mode: str = "inverse") -> np.ndarray:
+        """Edge lengths aligned with indices, derived from weights (cached).
+
+        Strong links must be short: "inverse" and "neg_log" turn strengths
+        into distances; "raw" keeps NetworkX's weight-as-distance reading.
+        "neg_log" normalizes by the total edge weight, so every length
+        changes whenever any weight does.
+
+        Args:
+            mode: One of DISTANCE_MODES (default: inverse)
+
+        Returns:
+            Length per stored entry (read-only, shared between callers)
+
+        Raises:
+            ValueError: If mode is unknown
+        """
+        if mode not in self.DISTANCE_MODES:
+            raise ValueError(f"Unknown distance mode '{mode}', "
+                             f"expected one of {self.DISTANCE_MODES}")
+
+        lengths = self._edge_lengths.get(mode)
+        if lengths is None:
+            if mode == "raw":
+                lengths = self.weights.copy()
+            elif mode == "inverse":
+                lengths = 1.0 / self.weights
+            else:
+                _, _, weights = self.edges()
+                lengths = -np.log(self.weights / weights.sum())
+            lengths.flags.writeable = False
+            self._edge_lengths[mode] = lengths
+        return lengths
+
+    def row_ids(self) -> np.ndarray:
+        """Source node ID of every stored entry (expanded indptr)."""
+        return np.repeat(np.arange(self.number_of_nodes(), dtype=np.int32), np.diff(self.indptr))
+
+    def number_of_nodes(self) -> int:
+        """Number of nodes."""
+        return len(self.nodes)
+
+    def number_of_edges(self) -> int:
+        """Number of undirected edges (self-loops count once)."""
+        return int(np.count_nonzero(self.row_ids() <= self.indices))
+
+    def neighbors(self, node: int) -> np.ndarray:
+        """Neighbor IDs of a node ID."""
+        return self.indices[self.indptr[node]:self.indptr[node + 1]]
+
+    def degree(self) -> np.ndarray:
+        """Unweighted degree per node (self-loops count twice, as in NetworkX)."""
+        return self._row_totals(np.ones_like(self.weights))
+
+    def strength(self) -> np.ndarray:
+        """Weighted degree per node (self-loops count twice, as in NetworkX)."""
+        return self._row_totals(self.weights)
+
+    def aggregate(self, group: np.ndarray) -> "CSRGraph":
+        """Quotient graph with one node per group (see aggregate_csr).
+
+        Args:
+            group: Group ID per node ID, covering 0..k-1
+
+        Returns:
+            CSRGraph whose node k stands for every node of group k
+        """
+        indptr, indices, weights = aggregate_csr(self.indptr, self.indices, self.weights, group)
+        return CSRGraph(range(len(indptr) - 1), indptr, indices, weights)
+
+    def _row_totals(self, values: np.ndarray) -> np.ndarray:
+        """Per-node sum of values, counting self-loop entries twice."""
+        rows = self.row_ids()
+        doubled = np.where(rows == self.indices, 2 * values, values)
+        return np.bincount(rows, weights=doubled, minlength=self.number_of_nodes())
+
+    def __len__(self) -> int:
+        return self.number_of_nodes()
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.nodes)
+
+    def __contains__(self, node: Hashable) -> bool:
+        return node in self.node_index
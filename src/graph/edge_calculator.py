@@ -6,10 +6,17 @@ Example:
 - "research" and "laboratory" appear 5 times as bigrams: 3+3+3+3+3 = 15
 - They also appear 3 times with 1 word between: 2+2+2 = 6
 - Final weight = 15 + 6 = 21 (NO normalization)
+
+The fused path (calculate_weights_from_ids) generates the TWO-PASS
+pairs and sums their weights in one vectorized scan over token IDs,
+without an intermediate n-gram list or per-pair sorting.
 """
 
-from typing import List, Tuple, Dict
-from collections import defaultdict
+import numpy as np
+from typing import Iterable, List, Optional, Tuple, Dict
+
+# Upper bound on token IDs for the fused path (keys stay within int64)
+MAX_VOCAB_SIZE = 1 << 31
 
 
 class EdgeCalculator:
@@ -25,15 +32,110 @@ class EdgeCalculator:
         Returns:
             Dictionary mapping edge to final weight
         """
-        edge_weights = defaultdict(int)
+        return dict(EdgeCalculator.accumulate_weights(ngrams))
+    
+    @staticmethod
+    def accumulate_weights(ngrams: Iterable[Tuple[str, str, int]],
+                           edge_weights: Optional[Dict[Tuple[str, str], int]] = None
+                           ) -> Dict[Tuple[str, str], int]:
+        """Add n-gram weights into an edge accumulator.
+        
+        Consumes ngrams lazily, so a generator (e.g.
+        NGramGenerator.generate_from_stream) is never materialized.
+        
+        Args:
+            ngrams: Iterable of (source, target, weight) tuples
+            edge_weights: Existing accumulator to add into (new one if None)
+        
+        Returns:
+            The accumulator, mapping edge to summed weight
+        """
+        if edge_weights is None:
+            edge_weights = {}
         
         for source, target, weight in ngrams:
             # Undirected edge (sorted order for consistency)
-            edge_key = tuple(sorted([source, target]))
+            edge_key = (min(source, target), max(source, target))
             # ADDITIVE: sum all weights
-            edge_weights[edge_key] += weight
+            edge_weights[edge_key] = edge_weights.get(edge_key, 0) + weight
+        
+        return edge_weights
+    
+    @staticmethod
+    def calculate_weights_from_ids(ids_per_para: Iterable[np.ndarray],
+                                   vocab_size: int = MAX_VOCAB_SIZE,
+                                   batch_tokens: int = 1 << 20
+                                   ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Fused TWO-PASS n-gram generation and ADDITIVE weight accumulation.
+        
+        Equivalent to calculate_weights over NGramGenerator.generate of each
+        paragraph. For a token at position j of a paragraph of n tokens, the
+        summed contribution towards the token k positions later is:
+        - k = 1 (bigram): 3
+        - k = 2 (distance 1): 2 per 4-gram window covering the pair, i.e.
+          2 at both ends of the paragraph and 4 in between (needs n >= 4)
+        - k = 3 (distance 2): 1
+        Paragraphs are concatenated into batches and pairs crossing a
+        paragraph break are masked out. Pairs are keyed as
+        min_id * vocab_size + max_id (no per-pair sorting) and summed with
+        np.unique + np.bincount into the running edge table.
+        
+        Args:
+            ids_per_para: Token-ID arrays (one per paragraph), consumed lazily
+            vocab_size: Upper bound on token IDs (default: 2**31)
+            batch_tokens: Tokens buffered before a batch is accumulated
+        
+        Returns:
+            (sources, targets, weights) arrays with sources <= targets, one
+            row per distinct undirected edge
+        """
+        keys = np.empty(0, dtype=np.int64)
+        weights = np.empty(0, dtype=np.int64)
+        batch: List[np.ndarray] = []
+        buffered = 0
+        
+        def accumulate() -> None:
+            nonlocal keys, weights
+            flat = np.concatenate(batch)
+            lengths = np.array([len(ids) for ids in batch], dtype=np.int64)
+            starts = np.cumsum(lengths) - lengths
+            # Position of each token inside its paragraph, and that paragraph's length
+            para_len = np.repeat(lengths, lengths)
+            pos = np.arange(len(flat), dtype=np.int64) - np.repeat(starts, lengths)
+            
+            new_keys, new_weights = [keys], [weights]
+            for offset in (1, 2, 3):
+                valid = np.flatnonzero(pos[:-offset] + offset < para_len[:-offset])
+                if offset > 1:
+                    # PASS 2 only runs on paragraphs with a 4-gram window
+                    valid = valid[para_len[valid] >= 4]
+                a, b = flat[valid], flat[valid + offset]
+                new_keys.append(np.minimum(a, b) * vocab_size + np.maximum(a, b))
+                if offset == 1:
+                    new_weights.append(np.full(len(valid), 3, dtype=np.int64))
+                elif offset == 2:
+                    at_end = (pos[valid] == 0) | (pos[valid] == para_len[valid] - 3)
+                    new_weights.append(np.where(at_end, 2, 4).astype(np.int64))
+                else:
+                    new_weights.append(np.ones(len(valid), dtype=np.int64))
+            
+            keys, inverse = np.unique(np.concatenate(new_keys), return_inverse=True)
+            weights = np.bincount(inverse.ravel(),
+                                  weights=np.concatenate(new_weights)).astype(np.int64)
+            batch.clear()
+        
+        for ids in ids_per_para:
+            if len(ids) < 2:
+                continue
+            batch.append(np.asarray(ids, dtype=np.int64))
+            buffered += len(ids)
+            if buffered >= batch_tokens:
+                accumulate()
+                buffered = 0
         
-        return dict(edge_weights)
+        if batch:
+            accumulate()
+        return keys // vocab_size, keys % vocab_size, weights
     
     @staticmethod
     def validate_no_normalization(edge_weights: Dict[Tuple[str, str], int]) -> bool:
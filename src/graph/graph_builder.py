@@ -4,11 +4,18 @@ Builds NetworkX graph from n-grams with EXACT weight calculation:
 - ADDITIVE weighting (sum all co-occurrences)
 - NO normalization
 - Raw weights used in all algorithms
+
+Graphs can grow incrementally: appending a statement's n-grams adds its
+weights in place (O(statement), not O(corpus)) and reports what changed.
+Deleting a statement retracts exactly the weights it added.
 """
 
 import networkx as nx
-from typing import List, Tuple, Dict
-from collections import defaultdict
+import numpy as np
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from .edge_calculator import EdgeCalculator
+from .csr_graph import CSRGraph
 
 
 class GraphBuilder:
@@ -18,24 +25,20 @@ class GraphBuilder:
         """Initialize graph builder."""
         self.graph = None
     
-    def build_from_ngrams(self, ngrams: List[Tuple[str, str, int]]) -> nx.Graph:
+    def build_from_ngrams(self, ngrams: Iterable[Tuple[str, str, int]]) -> nx.Graph:
         """Build graph from n-grams with ADDITIVE weights.
         
         Critical: NO normalization applied!
         
         Args:
-            ngrams: List of (source, target, weight) tuples
+            ngrams: Iterable of (source, target, weight) tuples (a generator
+                is consumed lazily, never materialized)
         
         Returns:
             NetworkX graph with weighted edges
         """
-        edge_weights = defaultdict(int)
-        
         # Accumulate weights (ADDITIVE)
-        for source, target, weight in ngrams:
-            # Create undirected edge key (sorted order)
-            edge_key = tuple(sorted([source, target]))
-            edge_weights[edge_key] += weight
+        edge_weights = EdgeCalculator.accumulate_weights(ngrams)
         
         # Build NetworkX graph
         graph = nx.Graph()
@@ -46,6 +49,153 @@ class GraphBuilder:
         self.graph = graph
         return graph
     
+    def build_from_tokens(self, tokens_per_para: Iterable[List[str]]) -> nx.Graph:
+        """Build graph straight from paragraph tokens (fused fast path).
+        
+        Same graph as build_from_ngrams over NGramGenerator output, but the
+        token stream is scanned once into a compact edge-weight table.
+        
+        Args:
+            tokens_per_para: Lemmatized token lists (one per paragraph)
+        
+        Returns:
+            NetworkX graph with weighted edges
+        """
+        nodes, sources, targets, weights = self._accumulate_tokens(tokens_per_para)
+        
+        words = np.array(nodes, dtype=object)
+        graph = nx.Graph()
+        graph.add_weighted_edges_from(
+            zip(words[sources].tolist(), words[targets].tolist(), weights.tolist())
+        )
+        
+        self.graph = graph
+        return graph
+    
+    def build_csr_from_tokens(self, tokens_per_para: Iterable[List[str]]) -> CSRGraph:
+        """Build a compact CSR graph from paragraph tokens (no NetworkX).
+        
+        Args:
+            tokens_per_para: Lemmatized token lists (one per paragraph)
+        
+        Returns:
+            CSRGraph with the same weighted edges as build_from_tokens
+        """
+        nodes, sources, targets, weights = self._accumulate_tokens(tokens_per_para)
+        return CSRGraph.from_edges(nodes, sources, targets, weights)
+    
+    @staticmethod
+    def _accumulate_tokens(tokens_per_para: Iterable[List[str]]
+                           ) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+        """Encode tokens and run the fused edge accumulation."""
+        vocabulary: Dict[str, int] = {}
+        ids_per_para = (
+            np.fromiter((vocabulary.setdefault(token, len(vocabulary)) for token in tokens),
+                        dtype=np.int64)
+            for tokens in tokens_per_para
+            # Paragraphs under two tokens add no edge, so their tokens must
+            # not become (isolated) nodes either
+            if len(tokens) >= 2
+        )
+        # The vocabulary fills up as paragraphs are consumed, so the key
+        # space uses the default upper bound rather than its final size
+        sources, targets, weights = EdgeCalculator.calculate_weights_from_ids(ids_per_para)
+        return list(vocabulary), sources, targets, weights
+    
+    def append_ngrams(self, ngrams: Iterable[Tuple[str, str, int]]) -> Dict[str, Set[Any]]:
+        """Add the n-grams of new text to the current graph in place.
+        
+        Weights stay ADDITIVE: appending text is equivalent to rebuilding
+        from all n-grams, without touching the rest of the corpus.
+        
+        Args:
+            ngrams: Iterable of (source, target, weight) tuples of the new text
+        
+        Returns:
+            Dictionary describing the change:
+            - nodes_added: nodes that did not exist before
+            - nodes_touched: all nodes incident to a changed edge
+            - edges_added: edges (sorted pairs) that did not exist before
+            - edges_touched: all edges whose weight changed
+        """
+        if self.graph is None:
+            self.graph = nx.Graph()
+        graph = self.graph
+        
+        changes: Dict[str, Set[Any]] = {"nodes_added": set(), "nodes_touched": set(),
+                                        "edges_added": set(), "edges_touched": set()}
+        
+        for (source, target), weight in EdgeCalculator.accumulate_weights(ngrams).items():
+            for node in (source, target):
+                if node not in graph:
+                    changes["nodes_added"].add(node)
+                changes["nodes_touched"].add(node)
+            
+            if graph.has_edge(source, target):
+                graph[source][target]['weight'] += weight
+            else:
+                graph.add_edge(source, target, weight=weight)
+                changes["edges_added"].add((source, target))
+            changes["edges_touched"].add((source, target))
+        
+        return changes
+    
+    def retract_ngrams(self, ngrams: Iterable[Tuple[str, str, int]]) -> Dict[str, Set[Any]]:
+        """Subtract the n-grams of deleted text from the current graph in place.
+        
+        Because weights are ADDITIVE with no normalization, subtracting a
+        statement's 3/2/1 contributions restores the graph it would have
+        without that statement. Edges whose weight reaches zero are
+        removed, then nodes left without edges.
+        
+        Args:
+            ngrams: Iterable of (source, target, weight) tuples of the deleted text
+        
+        Returns:
+            Dictionary describing the change:
+            - nodes_removed: nodes left without edges and removed
+            - nodes_touched: all nodes incident to a changed edge
+            - edges_removed: edges (sorted pairs) whose weight reached zero
+            - edges_touched: all edges whose weight changed
+        
+        Raises:
+            ValueError: If the n-grams were never added (edge missing or weight
+                would become negative); the graph is left unchanged
+        """
+        graph = self.graph if self.graph is not None else nx.Graph()
+        deltas = EdgeCalculator.accumulate_weights(ngrams)
+        
+        # Validate everything first so a bad retraction changes nothing
+        for (source, target), weight in deltas.items():
+            if not graph.has_edge(source, target):
+                raise ValueError(f"Cannot retract missing edge ({source!r}, {target!r})")
+            if graph[source][target]['weight'] < weight:
+                raise ValueError(
+                    f"Cannot retract weight {weight} from edge ({source!r}, {target!r}) "
+                    f"with weight {graph[source][target]['weight']}"
+                )
+        
+        changes: Dict[str, Set[Any]] = {"nodes_removed": set(), "nodes_touched": set(),
+                                        "edges_removed": set(), "edges_touched": set()}
+        
+        for (source, target), weight in deltas.items():
+            changes["nodes_touched"].update((source, target))
+            changes["edges_touched"].add((source, target))
+            
+            remaining = graph[source][target]['weight'] - weight
+            if remaining == 0:
+                graph.remove_edge(source, target)
+                changes["edges_removed"].add((source, target))
+            else:
+                graph[source][target]['weight'] = remaining
+        
+        for node in changes["nodes_touched"]:
+            if graph.degree(node) == 0:
+                graph.remove_node(node)
+                changes["nodes_removed"].add(node)
+        
+        return changes
+    
     def get_graph_stats(self) -> Dict[str, int]:
         """Get basic graph statistics.
         
@@ -0,0 +1,90 @@
+"""Tests for the compact CSR graph representation"""
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from src.graph.csr_graph import CSRGraph
+from src.graph.graph_builder import GraphBuilder
+from tests.fixtures.sample_graphs import create_sample_graph
+
+
+def test_networkx_round_trip():
+    """Test conversion to CSR and back preserves nodes, edges and weights."""
+    graph = create_sample_graph()
+    graph.add_edge("ai", "ai", weight=2)
+    graph.add_node("isolated")
+
+    csr = CSRGraph.from_networkx(graph)
+    restored = csr.to_networkx()
+
+    assert csr.number_of_nodes() == graph.number_of_nodes()
+    assert csr.number_of_edges() == graph.number_of_edges()
+    assert set(restored.nodes()) == set(graph.nodes())
+    assert nx.utils.edges_equal(restored.edges(data="weight"), graph.edges(data="weight"))
+
+
+def test_rows_are_sorted_neighbor_lists():
+    """Test each CSR row holds the node's neighbors."""
+    graph = create_sample_graph()
+    csr = CSRGraph.from_networkx(graph)
+
+    for node in graph.nodes():
+        row = csr.neighbors(csr.node_index[node])
+        assert list(row) == sorted(row)
+        assert {csr.nodes[i] for i in row} == set(graph.neighbors(node))
+
+
+def test_degree_and_strength_match_networkx():
+    """Test degrees count self-loops twice, as NetworkX does."""
+    graph = create_sample_graph()
+    graph.add_edge("tool", "tool", weight=4)
+    csr = CSRGraph.from_networkx(graph)
+
+    expected_degree = [graph.degree(node) for node in csr.nodes]
+    expected_strength = [graph.degree(node, weight="weight") for node in csr.nodes]
+
+    assert csr.degree().tolist() == expected_degree
+    assert np.allclose(csr.strength(), expected_strength)
+
+
+def test_edge_lengths_are_cached_transforms():
+    """Test strength → length modes and their per-graph cache."""
+    csr = CSRGraph.from_networkx(create_sample_graph())
+    total = csr.edges()[2].sum()
+
+    assert np.allclose(csr.edge_lengths("inverse"), 1 / csr.weights)
+    assert np.allclose(csr.edge_lengths("neg_log"), -np.log(csr.weights / total))
+    assert np.array_equal(csr.edge_lengths("raw"), csr.weights)
+    assert csr.edge_lengths("inverse") is csr.edge_lengths("inverse")
+    assert not csr.edge_lengths("inverse").flags.writeable
+
+    with pytest.raises(ValueError):
+        csr.edge_lengths("squared")
+
+
+def test_build_csr_from_tokens():
+    """Test the builder's CSR output matches its NetworkX output."""
+    paragraphs = [["research", "laboratory", "experiment", "analysis", "research"],
+                  ["data", "model", "data"], ["isolated"], []]
+
+    graph = GraphBuilder().build_from_tokens(paragraphs)
+    csr = GraphBuilder().build_csr_from_tokens(paragraphs)
+
+    assert sorted(csr.nodes) == sorted(graph.nodes)
+
+    assert nx.utils.edges_equal(csr.to_networkx().edges(data="weight"),
+                                graph.edges(data="weight"))
+
+
+def test_aggregate_merges_groups():
+    """Test grouped nodes collapse into one node keeping every edge's weight."""
+    graph = nx.Graph()
+    graph.add_weighted_edges_from([("a", "b", 1), ("b", "c", 2), ("c", "d", 3), ("a", "a", 4)])
+    csr = CSRGraph.from_networkx(graph, nodes=["a", "b", "c", "d"])
+
+    quotient = csr.aggregate(np.array([0, 0, 1, 1]))
+
+    assert nx.utils.edges_equal(quotient.to_networkx().edges(data="weight"),
+                                [(0, 0, 5.0), (0, 1, 2.0), (1, 1, 3.0)])
+    assert np.isclose(quotient.strength().sum(), csr.strength().sum())
@@ -0,0 +1,60 @@
+"""Tests for fused n-gram generation and edge accumulation"""
+
+import random
+
+from src.nlp.ngram_generator import NGramGenerator
+from src.graph.edge_calculator import EdgeCalculator
+from src.graph.graph_builder import GraphBuilder
+
+
+def make_paragraphs(seed: int = 7, count: int = 200):
+    """Random paragraphs of 0-12 tokens over a small vocabulary (self-loops included)."""
+    rng = random.Random(seed)
+    vocabulary = ["research", "laboratory", "experiment", "analysis", "data", "model"]
+    return [[rng.choice(vocabulary) for _ in range(rng.randint(0, 12))] for _ in range(count)]
+
+
+def edge_dict(graph):
+    """Graph edges as {sorted pair: weight}."""
+    return {tuple(sorted((u, v))): data["weight"] for u, v, data in graph.edges(data=True)}
+
+
+def test_fused_weights_match_tuple_path():
+    """Test fused accumulation equals calculate_weights over generate()."""
+    generator = NGramGenerator()
+    paragraphs = make_paragraphs()
+    expected = EdgeCalculator.calculate_weights(generator.generate_from_paragraphs("", paragraphs))
+
+    vocabulary = {}
+    ids_per_para = [generator.encode(tokens, vocabulary) for tokens in paragraphs]
+    words = list(vocabulary)
+
+    # Small batches exercise accumulation into an existing edge table
+    for batch_tokens in (1 << 20, 16):
+        sources, targets, weights = EdgeCalculator.calculate_weights_from_ids(
+            ids_per_para, len(vocabulary), batch_tokens=batch_tokens
+        )
+        fused = {
+            tuple(sorted((words[a], words[b]))): w
+            for a, b, w in zip(sources.tolist(), targets.tolist(), weights.tolist())
+        }
+        assert fused == expected
+        assert (sources <= targets).all()
+
+
+def test_fused_short_paragraphs():
+    """Test 3-token paragraphs get bigrams only (no 4-gram window)."""
+    sources, targets, weights = EdgeCalculator.calculate_weights_from_ids([[0, 1, 2]], 3)
+
+    assert list(zip(sources.tolist(), targets.tolist(), weights.tolist())) == [(0, 1, 3), (1, 2, 3)]
+
+
+def test_build_from_tokens_matches_build_from_ngrams():
+    """Test the fused graph builder produces the same weighted graph."""
+    paragraphs = make_paragraphs(seed=11)
+    ngrams = NGramGenerator().generate_from_paragraphs("", paragraphs)
+
+    expected = GraphBuilder().build_from_ngrams(ngrams)
+    fused = GraphBuilder().build_from_tokens(iter(paragraphs))
+
+    assert edge_dict(fused) == edge_dict(expected)
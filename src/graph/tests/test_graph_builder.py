@@ -0,0 +1,73 @@
+"""Tests for incremental graph updates"""
+
+import networkx as nx
+import pytest
+
+from src.nlp.ngram_generator import NGramGenerator
+from src.graph.graph_builder import GraphBuilder
+
+STATEMENTS = [
+    ["research", "laboratory", "experiment", "analysis"],
+    ["laboratory", "experiment", "data"],
+    ["model", "analysis", "research", "model", "training"],
+]
+
+
+def test_append_matches_full_rebuild():
+    """Test appending statements one by one equals building from all n-grams."""
+    generator = NGramGenerator()
+    all_ngrams = [ngram for tokens in STATEMENTS for ngram in generator.generate(tokens)]
+    expected = GraphBuilder().build_from_ngrams(all_ngrams)
+
+    builder = GraphBuilder()
+    for tokens in STATEMENTS:
+        builder.append_ngrams(generator.generate(tokens))
+
+    assert nx.utils.edges_equal(builder.graph.edges(data="weight"), expected.edges(data="weight"))
+
+
+def test_append_reports_touched_nodes_and_edges():
+    """Test the change report separates new and updated nodes/edges."""
+    generator = NGramGenerator()
+    builder = GraphBuilder()
+    builder.build_from_ngrams(generator.generate(STATEMENTS[0]))
+
+    changes = builder.append_ngrams(generator.generate(STATEMENTS[1]))
+
+    assert changes["nodes_added"] == {"data"}
+    assert changes["nodes_touched"] == {"laboratory", "experiment", "data"}
+    assert changes["edges_added"] == {("data", "experiment")}
+    assert changes["edges_touched"] == {("experiment", "laboratory"), ("data", "experiment")}
+    assert builder.graph["laboratory"]["experiment"]["weight"] == 6
+
+
+def test_retract_restores_graph_without_statement():
+    """Test retracting a statement equals building without it."""
+    generator = NGramGenerator()
+    builder = GraphBuilder()
+    for tokens in STATEMENTS:
+        builder.append_ngrams(generator.generate(tokens))
+
+    changes = builder.retract_ngrams(generator.generate(STATEMENTS[1]))
+
+    expected = GraphBuilder().build_from_ngrams(
+        generator.generate(STATEMENTS[0]) + generator.generate(STATEMENTS[2])
+    )
+    assert set(builder.graph.nodes()) == set(expected.nodes())
+    assert nx.utils.edges_equal(builder.graph.edges(data="weight"), expected.edges(data="weight"))
+    assert changes["nodes_removed"] == {"data"}
+    assert changes["edges_removed"] == {("data", "experiment")}
+    assert builder.graph["laboratory"]["experiment"]["weight"] == 3
+
+
+def test_retract_unknown_ngrams_leaves_graph_unchanged():
+    """Test retracting n-grams that were never added raises and changes nothing."""
+    generator = NGramGenerator()
+    builder = GraphBuilder()
+    builder.build_from_ngrams(generator.generate(STATEMENTS[0]))
+    before = list(builder.graph.edges(data="weight"))
+
+    with pytest.raises(ValueError):
+        builder.retract_ngrams(generator.generate(STATEMENTS[0]) + [("research", "unknown", 3)])
+
+    assert list(builder.graph.edges(data="weight")) == before
@@ -4,6 +4,7 @@ Components:
 - text_processor: Main text processing pipeline
 - stopwords: English stopwords management
 - ngram_generator: TWO-PASS 4-gram window algorithm
+- model_registry: Shared, lazily loaded spaCy models
 
 Processing order (CRITICAL):
 1. Tokenization
@@ -18,5 +19,6 @@ Processing order (CRITICAL):
 from .text_processor import TextProcessor
 from .stopwords import ENGLISH_STOPWORDS
 from .ngram_generator import NGramGenerator
+from .model_registry import ModelRegistry
 
-__all__ = ["TextProcessor", "ENGLISH_STOPWORDS", "NGramGenerator"]
+__all__ = ["TextProcessor", "ENGLISH_STOPWORDS", "NGramGenerator", "ModelRegistry"]
@@ -0,0 +1,122 @@
+"""Fast-Path Regex Tokenizer and Lookup Lemmatizer
+
+spaCy-free backend for bulk backfills:
+- Compiled-regex tokenization (URLs removed first)
+- Same filtering order as TextProcessor: special chars, URLs,
+  numbers, stopwords (BEFORE lemmatization), then lemmatization
+- Lemmas from spaCy's English lookup table (spacy-lookups-data)
+
+Trades some lemma accuracy (no POS context, e.g. "saw" → "see"
+even as a noun) for much higher throughput. Lemmas mode only:
+there is no entity recognition on this path.
+"""
+
+import re
+from spacy.lookups import Table, load_lookups
+from typing import Dict, List, Set
+
+
+class FastLemmatizer:
+    """Regex tokenizer + lookup-table lemmatizer."""
+
+    URL_PATTERN = re.compile(r"(?:https?://|www\.)\S+", re.IGNORECASE)
+    # Words with inner apostrophes; hyphens split words as spaCy's infixes do
+    TOKEN_PATTERN = re.compile(r"\w+(?:'\w+)*")
+
+    _tables: Dict[str, Table] = {}
+
+    def __init__(self, lang: str = "en"):
+        """Initialize lemmatizer.
+
+        Args:
+            lang: Language of the lemma lookup table (default: en)
+        """
+        self.lang = lang
+        self._cache: Dict[str, str] = {}
+
+    @property
+    def table(self) -> Table:
+        """Lemma lookup table, loaded once per process.
+
+        Raises:
+            ImportError: If spacy-lookups-data (or its table for lang) is missing
+        """
+        if self.lang not in FastLemmatizer._tables:
+            try:
+                lookups = load_lookups(self.lang, ["lemma_lookup"])
+            except ValueError as error:
+                raise ImportError(
+                    f"The regex backend needs the '{self.lang}' lemma_lookup table from "
+                    "spacy-lookups-data; install it with 'pip install spacy-lookups-data' "
+                    "or use backend='spacy'"
+                ) from error
+            FastLemmatizer._tables[self.lang] = lookups.get_table("lemma_lookup")
+        return FastLemmatizer._tables[self.lang]
+
+    def tokenize(self, text: str) -> List[str]:
+        """Split text into surface tokens (steps 1-3).
+
+        Clitics are split the way spaCy splits them and the clitic part
+        is dropped as a special-character token ("doesn't" → "does",
+        "company's" → "company").
+
+        Args:
+            text: Input text
+
+        Returns:
+            List of surface tokens
+        """
+        text = self.URL_PATTERN.sub(" ", text)
+
+        tokens = []
+        for token in self.TOKEN_PATTERN.findall(text):
+            if "'" in token:
+                lower = token.lower()
+                if lower.endswith("n't") and len(token) > 3:
+                    token = token[:-3]
+                else:
+                    token = token.split("'", 1)[0]
+            tokens.append(token)
+        return tokens
+
+    def lemmatize(self, token: str) -> str:
+        """Look up the lemma of a surface token (lowercased).
+
+        Args:
+            token: Surface token
+
+        Returns:
+            Lowercased lemma (the token itself if not in the table)
+        """
+        lemma = self._cache.get(token)
+        if lemma is None:
+            lemma = self.table.get(token)
+            # Capitalized words fall back to their lowercase entry, but
+            # acronyms do not ("AI" must not become "ai" → "have")
+            if lemma is None and not token.isupper():
+                lemma = self.table.get(token.lower())
+            lemma = (lemma or token).lower()
+            self._cache[token] = lemma
+        return lemma
+
+    def process(self, text: str, stopwords: Set[str]) -> List[str]:
+        """Run the full fast pipeline.
+
+        Args:
+            text: Input text
+            stopwords: Stopwords set (matched on lowercased surface form)
+
+        Returns:
+            List of lemmatized tokens
+        """
+        lemmas = []
+        for token in self.tokenize(text):
+            # 4. Number filtering (numbers inside words are preserved)
+            if token.isdigit():
+                continue
+            # 5. Stopwords removal (BEFORE lemmatization)
+            if token.lower() in stopwords:
+                continue
+            # 6. Lemmatization
+            lemmas.append(self.lemmatize(token))
+        return lemmas
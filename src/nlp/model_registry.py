@@ -0,0 +1,83 @@
+"""spaCy Model Registry
+
+Process-wide, lazily populated cache of loaded spaCy pipelines:
+- Keyed by (model name, excluded components)
+- A model is loaded on first use, then shared by every TextProcessor
+- warm_up() preloads models (e.g. on FastAPI startup)
+
+Loading en_core_web_sm costs seconds and a few hundred MB, so it must
+happen once per process rather than once per processor. Components are
+excluded (never loaded) rather than disabled: spaCy still loads the
+weights of disabled components. Per-call pruning belongs in
+nlp(text, disable=...) on the one shared pipeline.
+"""
+
+import threading
+import spacy
+from spacy.language import Language
+from typing import Dict, Iterable, Tuple
+
+DEFAULT_MODEL = "en_core_web_sm"
+
+
+class ModelRegistry:
+    """Shared cache of loaded spaCy pipelines."""
+
+    _models: Dict[Tuple[str, Tuple[str, ...]], Language] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _key(model: str, exclude: Iterable[str]) -> Tuple[str, Tuple[str, ...]]:
+        """Build the cache key (excluded components are order-insensitive)."""
+        return (model, tuple(sorted(set(exclude))))
+
+    @classmethod
+    def get(cls, model: str = DEFAULT_MODEL, exclude: Iterable[str] = ()) -> Language:
+        """Get a loaded pipeline, loading it on first use.
+
+        Args:
+            model: spaCy model name or path
+            exclude: Pipeline components to leave out entirely
+
+        Returns:
+            Shared spaCy Language object
+        """
+        key = cls._key(model, exclude)
+        nlp = cls._models.get(key)
+        if nlp is not None:
+            return nlp
+
+        with cls._lock:
+            # Another thread may have loaded it while we waited
+            if key not in cls._models:
+                cls._models[key] = spacy.load(model, exclude=list(key[1]))
+            return cls._models[key]
+
+    @classmethod
+    def warm_up(cls, models: Iterable[str] = (DEFAULT_MODEL,),
+                exclude: Iterable[str] = ()) -> None:
+        """Preload models so the first request does not pay the load cost.
+
+        Args:
+            models: Model names to load
+            exclude: Pipeline components to leave out entirely
+        """
+        exclude = tuple(exclude)
+        for model in models:
+            cls.get(model, exclude)
+
+    @classmethod
+    def is_loaded(cls, model: str = DEFAULT_MODEL, exclude: Iterable[str] = ()) -> bool:
+        """Check whether a pipeline is already cached."""
+        return cls._key(model, exclude) in cls._models
+
+    @classmethod
+    def loaded(cls) -> int:
+        """Number of pipelines currently cached."""
+        return len(cls._models)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all cached pipelines."""
+        with cls._lock:
+            cls._models.clear()
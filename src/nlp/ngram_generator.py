@@ -7,9 +7,17 @@ Implements exact TWO-PASS 4-gram window algorithm:
   - Distance 2 (2 words apart) → weight = 1
 
 CRITICAL: Paragraph breaks (\\n\\n) STOP the algorithm!
+
+Large inputs can be streamed: text is read from a file handle or an
+iterator of chunks, split on the paragraph delimiter and tokenized one
+paragraph at a time, so memory stays bounded by the largest paragraph.
+
+Vocabulary-encoded mode works on int32 token-ID arrays and builds the
+pair arrays with shifted-array slicing instead of Python tuples.
 """
 
-from typing import List, Tuple
+import numpy as np
+from typing import Callable, Dict, Iterable, Iterator, List, TextIO, Tuple, Union
 
 
 class NGramGenerator:
@@ -68,3 +76,158 @@ class NGramGenerator:
             all_ngrams.extend(para_ngrams)
         
         return all_ngrams
+    
+    def iter_paragraphs(self, source: Union[TextIO, Iterable[str]],
+                        chunk_size: int = 1 << 16) -> Iterator[str]:
+        """Split streamed text into paragraphs without reading it all.
+        
+        Args:
+            source: File handle (anything with .read) or iterable of text chunks
+            chunk_size: Characters read per call from a file handle
+        
+        Yields:
+            Non-empty paragraphs, in input order
+        """
+        if hasattr(source, "read"):
+            chunks = iter(lambda: source.read(chunk_size), "")
+        else:
+            chunks = iter(source)
+        
+        delimiter = self.paragraph_delimiter
+        # A delimiter split across chunks starts in the last len - 1
+        # characters read, so only that carry is scanned again; the rest of
+        # the open paragraph waits in pending and is joined once
+        keep = len(delimiter) - 1
+        pending: List[str] = []
+        carry = ""
+        for chunk in chunks:
+            *paragraphs, tail = (carry + chunk).split(delimiter)
+            if paragraphs:
+                paragraphs[0] = "".join(pending) + paragraphs[0]
+                pending = []
+                for paragraph in paragraphs:
+                    if paragraph.strip():
+                        yield paragraph
+            
+            split = max(len(tail) - keep, 0)
+            if split:
+                pending.append(tail[:split])
+            carry = tail[split:]
+        
+        rest = "".join(pending) + carry
+        if rest.strip():
+            yield rest
+    
+    def generate_from_stream(self, source: Union[TextIO, Iterable[str]],
+                             tokenize: Callable[[str], List[str]]
+                             ) -> Iterator[Tuple[str, str, int]]:
+        """Lazily generate n-grams from streamed text, paragraph by paragraph.
+        
+        Feed the result straight into EdgeCalculator.accumulate_weights (or
+        GraphBuilder.build_from_ngrams) to build edges in flat memory.
+        
+        Args:
+            source: File handle or iterable of text chunks
+            tokenize: Callable turning one paragraph into lemmatized tokens
+        
+        Yields:
+            (source, target, weight) tuples, never crossing a paragraph break
+        """
+        for paragraph in self.iter_paragraphs(source):
+            yield from self.generate(tokenize(paragraph))
+    
+    @staticmethod
+    def encode(tokens: List[str], vocabulary: Dict[str, int] = None) -> np.ndarray:
+        """Encode tokens as an int32 token-ID array.
+        
+        Args:
+            tokens: List of lemmatized tokens
+            vocabulary: Token to ID mapping, extended in place with unseen
+                tokens (share one across paragraphs of a corpus)
+        
+        Returns:
+            int32 array of token IDs
+        """
+        if vocabulary is None:
+            vocabulary = {}
+        ids = [vocabulary.setdefault(token, len(vocabulary)) for token in tokens]
+        return np.asarray(ids, dtype=np.int32)
+    
+    @staticmethod
+    def generate_ids(token_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Generate n-gram pairs over token IDs (vectorized TWO-PASS).
+        
+        Row order matches generate(): distance-1 rows alternate between
+        the (w0, w2) and (w1, w3) pairs of each 4-gram window.
+        
+        Args:
+            token_ids: int32 array of token IDs for one paragraph
+        
+        Returns:
+            (bigrams, distance_1, distance_2) arrays of shape (k, 2);
+            weights are 3, 2 and 1 respectively
+        """
+        ids = np.asarray(token_ids, dtype=np.int32)
+        n = len(ids)
+        
+        # PASS 1: Bigrams (adjacent words, weight = 3)
+        bigrams = np.column_stack((ids[:-1], ids[1:])) if n > 1 else np.empty((0, 2), np.int32)
+        
+        # PASS 2: 4-gram windows starting at 0..n-4
+        windows = max(n - 3, 0)
+        distance_1 = np.empty((2 * windows, 2), dtype=np.int32)
+        distance_2 = np.empty((windows, 2), dtype=np.int32)
+        if windows:
+            distance_1[0::2, 0] = ids[:windows]
+            distance_1[0::2, 1] = ids[2:windows + 2]
+            distance_1[1::2, 0] = ids[1:windows + 1]
+            distance_1[1::2, 1] = ids[3:]
+            distance_2[:, 0] = ids[:windows]
+            distance_2[:, 1] = ids[3:]
+        
+        return bigrams.astype(np.int32, copy=False), distance_1, distance_2
+    
+    def generate_ids_from_paragraphs(self, ids_per_para: Iterable[np.ndarray]
+                                     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Generate ID pairs per paragraph and concatenate them.
+        
+        Args:
+            ids_per_para: Token-ID arrays (one per paragraph)
+        
+        Returns:
+            Concatenated (bigrams, distance_1, distance_2) arrays
+        """
+        parts = [self.generate_ids(ids) for ids in ids_per_para]
+        if not parts:
+            empty = np.empty((0, 2), dtype=np.int32)
+            return empty, empty.copy(), empty.copy()
+        return tuple(np.concatenate(arrays) for arrays in zip(*parts))
+    
+    @staticmethod
+    def decode(vocabulary: Dict[str, int], bigrams: np.ndarray, distance_1: np.ndarray,
+               distance_2: np.ndarray) -> List[Tuple[str, str, int]]:
+        """Convert the ID pair arrays of one paragraph back to generate() tuples.
+        
+        Args:
+            vocabulary: Token to ID mapping used for encoding
+            bigrams: Bigram pairs (weight 3)
+            distance_1: Distance-1 pairs (weight 2)
+            distance_2: Distance-2 pairs (weight 1)
+        
+        Returns:
+            List of (source, target, weight) tuples in generate() order
+        """
+        words = np.array(list(vocabulary), dtype=object)
+        
+        # Interleave window rows back into (d1, d1, d2) order per window
+        windows = len(distance_2)
+        window_pairs = np.empty((3 * windows, 2), dtype=np.int32)
+        window_pairs[0::3] = distance_1[0::2]
+        window_pairs[1::3] = distance_1[1::2]
+        window_pairs[2::3] = distance_2
+        
+        pairs = np.concatenate((bigrams, window_pairs))
+        weights = [3] * len(bigrams) + [2, 2, 1] * windows
+        
+        ngrams = list(zip(words[pairs[:, 0]].tolist(), words[pairs[:, 1]].tolist(), weights))
+        return ngrams
@@ -4,6 +4,8 @@ Exact 180+ word stopwords list based on InfraNodus specifications.
 Derived from Snowball stopwords with additions.
 """
 
+from typing import List
+
 ENGLISH_STOPWORDS = [
     # Articles
     "a", "an", "the",
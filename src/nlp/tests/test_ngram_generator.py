@@ -0,0 +1,113 @@
+"""Tests for streamed n-gram generation"""
+
+import io
+import time
+
+import numpy as np
+
+from src.nlp.ngram_generator import NGramGenerator
+from src.graph.edge_calculator import EdgeCalculator
+
+TEXT = "research laboratory experiment\n\nanalysis data\n\n\n\nmodel training loss curve"
+
+
+def test_iter_paragraphs_from_file_handle():
+    """Test paragraphs are split correctly when read in tiny chunks."""
+    generator = NGramGenerator()
+
+    paragraphs = list(generator.iter_paragraphs(io.StringIO(TEXT), chunk_size=3))
+
+    assert paragraphs == ["research laboratory experiment", "analysis data",
+                          "model training loss curve"]
+
+
+def test_iter_paragraphs_delimiter_split_across_chunks():
+    """Test a delimiter straddling two chunks still splits paragraphs."""
+    generator = NGramGenerator()
+
+    chunks = ["research laboratory\n", "\nexperiment analysis"]
+
+    assert list(generator.iter_paragraphs(chunks)) == ["research laboratory",
+                                                       "experiment analysis"]
+
+
+def test_iter_paragraphs_linear_without_delimiter():
+    """Test a long paragraph with no delimiter is read in linear time."""
+    generator = NGramGenerator()
+    chunk = "word\n" * 4096
+
+    def elapsed(n_chunks):
+        best = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            paragraphs = list(generator.iter_paragraphs([chunk] * n_chunks))
+            best = min(best, time.perf_counter() - start)
+        assert len(paragraphs) == 1
+        return best
+
+    # 8x the input; rescanning the buffer per chunk would cost about 64x
+    assert elapsed(800) < 24 * elapsed(100)
+
+
+def test_stream_matches_paragraph_generation():
+    """Test streamed n-grams equal the in-memory paragraph path."""
+    generator = NGramGenerator()
+    paragraphs = TEXT.split("\n\n")
+    tokens_per_para = [p.split() for p in paragraphs]
+
+    expected = generator.generate_from_paragraphs(TEXT, tokens_per_para)
+    streamed = list(generator.generate_from_stream(io.StringIO(TEXT), str.split))
+
+    assert streamed == expected
+    assert ("experiment", "analysis", 3) not in streamed
+
+
+def test_stream_feeds_edge_accumulator():
+    """Test streamed n-grams accumulate into the same edge weights."""
+    generator = NGramGenerator()
+    chunks = (TEXT[i:i + 5] for i in range(0, len(TEXT), 5))
+
+    edge_weights = EdgeCalculator.accumulate_weights(
+        generator.generate_from_stream(chunks, str.split)
+    )
+
+    expected = EdgeCalculator.calculate_weights(
+        generator.generate_from_paragraphs(TEXT, [p.split() for p in TEXT.split("\n\n")])
+    )
+    assert edge_weights == expected
+
+
+def test_id_generation_identical_to_tuple_path():
+    """Test vectorized ID pairs decode to exactly the tuple path output."""
+    generator = NGramGenerator()
+    vocabulary = {}
+    words = ["research", "laboratory", "experiment", "analysis", "research", "data", "model"]
+
+    for n in range(8):
+        tokens = words[:n]
+        ids = generator.encode(tokens, vocabulary)
+
+        assert ids.dtype == np.int32
+        decoded = generator.decode(vocabulary, *generator.generate_ids(ids))
+        assert decoded == generator.generate(tokens)
+
+
+def test_id_generation_pair_weights():
+    """Test the three arrays hold the weight-3, weight-2 and weight-1 pairs."""
+    generator = NGramGenerator()
+    bigrams, distance_1, distance_2 = generator.generate_ids(np.arange(4, dtype=np.int32))
+
+    assert bigrams.tolist() == [[0, 1], [1, 2], [2, 3]]
+    assert distance_1.tolist() == [[0, 2], [1, 3]]
+    assert distance_2.tolist() == [[0, 3]]
+
+
+def test_id_generation_respects_paragraphs():
+    """Test per-paragraph ID arrays never pair across a paragraph break."""
+    generator = NGramGenerator()
+    bigrams, distance_1, distance_2 = generator.generate_ids_from_paragraphs(
+        [np.array([0, 1], dtype=np.int32), np.array([2, 3], dtype=np.int32)]
+    )
+
+    assert bigrams.tolist() == [[0, 1], [2, 3]]
+    assert len(distance_1) == 0 and len(distance_2) == 0
@@ -0,0 +1,165 @@
+"""Tests for the TextProcessor pipeline and batched processing"""
+
+import pytest
+
+spacy = pytest.importorskip("spacy")
+
+from src.nlp import fast_lemmatizer
+from src.nlp.text_processor import TextProcessor
+from src.nlp.model_registry import ModelRegistry
+from tests.fixtures.sample_texts import SAMPLE_TEXT_1, SAMPLE_TEXT_2
+
+
+@pytest.fixture(scope="session")
+def model_path(tmp_path_factory):
+    """Lightweight model on disk: blank English, lookup lemmas, rule-based NER."""
+    nlp = spacy.blank("en")
+    nlp.add_pipe("lemmatizer", config={"mode": "lookup"})
+    ruler = nlp.add_pipe("entity_ruler", name="ner")
+    nlp.initialize()
+    ruler.add_patterns([{"label": "GPE", "pattern": "New York"}])
+    path = tmp_path_factory.mktemp("models") / "en_lookup"
+    nlp.to_disk(path)
+    return str(path)
+
+
+@pytest.fixture
+def processor(model_path):
+    """Processor backed by the lightweight model."""
+    return TextProcessor(model=model_path)
+
+
+def test_preprocessing_steps(processor):
+    """Test punctuation, URLs, numbers and stopwords are removed."""
+    result = processor.process("The companies visited https://example.com 42 times in 2020s!")
+
+    assert result["tokens"] == ["company", "visit", "time", "2020s"]
+    assert result["mode"] == "lemmas"
+
+
+def test_stopwords_before_lemmatization(processor):
+    """Test stopwords are matched on surface form, not lemma."""
+    processor.stopwords = {"being"}
+
+    assert processor.process("being was")["tokens"] == ["be"]
+
+
+def test_unknown_mode_rejected(processor):
+    """Test unknown extraction modes raise."""
+    with pytest.raises(ValueError):
+        processor.process("text", mode="keywords")
+
+
+def test_process_batch_matches_process(processor):
+    """Test batch results equal single calls, in input order."""
+    texts = [SAMPLE_TEXT_1, SAMPLE_TEXT_2, "", "Research laboratories"] * 3
+
+    expected = [processor.process(text) for text in texts]
+
+    assert processor.process_batch(texts, batch_size=2) == expected
+    assert processor.process_batch(iter(texts), n_process=2, batch_size=2) == expected
+
+
+def test_model_loaded_lazily_and_shared(model_path):
+    """Test the model loads on first use and is shared between processors."""
+    ModelRegistry.clear()
+    first = TextProcessor(model=model_path)
+    second = TextProcessor(model=model_path)
+
+    assert not ModelRegistry.is_loaded(model_path)
+
+    first.process("research")
+
+    assert ModelRegistry.is_loaded(model_path)
+    assert first.nlp is second.nlp
+
+
+def test_registry_keyed_by_excluded_components(model_path):
+    """Test excluded components give separate pipelines without their weights."""
+    full = ModelRegistry.get(model_path)
+    pruned = ModelRegistry.get(model_path, exclude=["lemmatizer"])
+
+    assert full is not pruned
+    assert pruned is ModelRegistry.get(model_path, exclude=("lemmatizer",))
+    assert "lemmatizer" not in pruned.component_names
+
+
+def test_pipeline_pruned_per_mode(model_path):
+    """Test every mode shares one loaded pipeline and lemmas mode skips NER."""
+    ModelRegistry.clear()
+    processor = TextProcessor(model=model_path)
+    processor.warm_up()
+    for mode in TextProcessor.MODES:
+        processor.process("New York", mode=mode)
+
+    assert ModelRegistry.loaded() == 1
+    assert processor.nlp.disabled == []
+    assert processor._parse("New York", "lemmas").ents == ()
+    assert len(processor._parse("New York", "mixed").ents) == 1
+
+    # Components excluded by the processor are never loaded at all
+    ModelRegistry.clear()
+    no_ner = TextProcessor(model=model_path, exclude=["ner"])
+    assert "ner" not in no_ner.nlp.component_names
+    assert no_ner.process("laboratories in New York", mode="mixed")["tokens"] == \
+        ["laboratory", "new", "york"]
+
+
+def test_mixed_mode_preserves_multiword_entities(processor):
+    """Test mixed mode keeps entities as single tokens."""
+    text = "laboratories in New York"
+
+    assert processor.process(text)["tokens"] == ["laboratory", "new", "york"]
+
+    result = processor.process(text, mode="mixed")
+    assert result["tokens"] == ["laboratory", "new york"]
+    assert result["entities"] == [{"text": "New York", "label": "GPE"}]
+
+    assert processor.process(text, mode="entities")["tokens"] == ["new york"]
+
+
+def test_regex_backend_matches_lookup_pipeline(processor):
+    """Test the regex backend yields the same token stream shape and lemmas."""
+    texts = [
+        SAMPLE_TEXT_1,
+        SAMPLE_TEXT_2,
+        "The company's labs doesn't use www.example.org or 42 co-op tools.",
+    ]
+
+    texts = [text.lower() for text in texts]
+
+    for text in texts:
+        spacy_result = processor.process(text)
+        regex_result = processor.process(text, backend="regex")
+
+        assert regex_result == spacy_result
+
+    assert processor.process_batch(texts, backend="regex") == processor.process_batch(texts)
+
+
+def test_regex_backend_casing(processor):
+    """Test capitalized words are lemmatized but acronyms are kept."""
+    result = processor.process("Companies use AI", backend="regex")
+
+    assert result["tokens"] == ["company", "use", "ai"]
+
+
+def test_regex_backend_lemmas_only(processor):
+    """Test the regex backend rejects entity modes and unknown backends."""
+    with pytest.raises(ValueError):
+        processor.process("text", mode="mixed", backend="regex")
+    with pytest.raises(ValueError):
+        processor.process("text", backend="nltk")
+
+
+def test_regex_backend_without_lookups_data(processor, monkeypatch):
+    """Test a missing spacy-lookups-data table raises a clear ImportError."""
+    def missing(lang, tables):
+        raise ValueError("[E955] Can't find table(s) lemma_lookup")
+
+    monkeypatch.setattr(fast_lemmatizer, "load_lookups", missing)
+    monkeypatch.setattr(fast_lemmatizer.FastLemmatizer, "_tables", {})
+    processor.fast_lemmatizer = fast_lemmatizer.FastLemmatizer()
+
+    with pytest.raises(ImportError, match="spacy-lookups-data"):
+        processor.process("companies", backend="regex")
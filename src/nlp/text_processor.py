@@ -5,47 +5,182 @@ Implements exact InfraNodus NLP specifications:
 - Custom stopwords (applied BEFORE lemmatization)
 - Three-mode entity extraction
 - Preprocessing: URLs, special chars, numbers
+- Batched processing through nlp.pipe (multi-process)
+- Lazy model loading through the shared ModelRegistry
+- One pipeline per model; components a mode never reads are skipped
+  per call (nlp(text, disable=...)), not loaded as separate copies
+- Optional spaCy-free "regex" backend for bulk backfills
 """
 
-import spacy
-from typing import List, Dict, Any, Tuple
+from spacy.language import Language
+from spacy.tokens import Doc, Token
+from typing import List, Dict, Any, Iterable, Optional
 import re
 
+from .stopwords import ENGLISH_STOPWORDS
+from .model_registry import ModelRegistry, DEFAULT_MODEL
+from .fast_lemmatizer import FastLemmatizer
+
 
 class TextProcessor:
     """Main text processing class following exact InfraNodus pipeline."""
-    
-    def __init__(self, model: str = "en_core_web_sm", stopwords: List[str] = None):
+
+    MODES = ("lemmas", "mixed", "entities")
+    BACKENDS = ("spacy", "regex")
+
+    # Components each mode skips per call (lemmas needs no parse and no NER)
+    MODE_DISABLED = {
+        "lemmas": ("parser", "ner"),
+        "mixed": ("parser",),
+        "entities": ("parser",),
+    }
+
+    # Tokens made only of word characters and inner hyphens survive step 2
+    WORD_PATTERN = re.compile(r"^\w+(?:-\w+)*$")
+
+    def __init__(self, model: str = DEFAULT_MODEL, stopwords: List[str] = None,
+                 exclude: Optional[List[str]] = None):
         """Initialize text processor.
-        
+
+        The spaCy model is not loaded here; it is fetched from the shared
+        ModelRegistry on first use.
+
         Args:
             model: spaCy model name (default: en_core_web_sm)
-            stopwords: Custom stopwords list (default: load from config)
+            stopwords: Custom stopwords list (default: ENGLISH_STOPWORDS)
+            exclude: Pipeline components to exclude (never loaded)
         """
-        self.nlp = spacy.load(model)
-        self.stopwords = set(stopwords) if stopwords else set()
-    
-    def process(self, text: str, mode: str = "lemmas") -> Dict[str, Any]:
+        self.model = model
+        self.exclude = tuple(exclude) if exclude else ()
+        self.stopwords = set(stopwords) if stopwords else set(ENGLISH_STOPWORDS)
+        self.fast_lemmatizer = FastLemmatizer()
+
+    @property
+    def nlp(self) -> Language:
+        """Shared spaCy pipeline (loaded lazily on first access)."""
+        return ModelRegistry.get(self.model, self.exclude)
+
+    def warm_up(self) -> None:
+        """Load the shared pipeline ahead of use (it serves every mode)."""
+        ModelRegistry.get(self.model, self.exclude)
+
+    def _parse(self, text: str, mode: str) -> Doc:
+        """Run the shared pipeline, skipping components the mode never reads."""
+        return self.nlp(text, disable=self.MODE_DISABLED[mode])
+
+    def process(self, text: str, mode: str = "lemmas",
+                backend: str = "spacy") -> Dict[str, Any]:
         """Process text through complete pipeline.
-        
+
         Args:
             text: Input text to process
             mode: Entity extraction mode ("lemmas", "mixed", "entities")
-        
+            backend: "spacy" (exact) or "regex" (fast, lemmas mode only)
+
         Returns:
             Dictionary with tokens, entities, and processed text
         """
-        # TODO: Implement processing pipeline
-        # 1. Tokenization
+        self._validate_backend(backend, mode)
+        if backend == "regex":
+            return self._process_fast(text, mode)
+        return self._extract(self._parse(text, mode), mode)
+
+    def process_batch(self, texts: Iterable[str], mode: str = "lemmas",
+                      n_process: int = 1, batch_size: int = 1000,
+                      backend: str = "spacy") -> List[Dict[str, Any]]:
+        """Process many texts through the pipeline with nlp.pipe.
+
+        Documents are streamed through spaCy in batches and, when
+        n_process > 1, spread across worker processes. nlp.pipe yields
+        documents in input order, so results line up with texts.
+
+        Args:
+            texts: Iterable of input texts (consumed lazily)
+            mode: Entity extraction mode ("lemmas", "mixed", "entities")
+            n_process: Number of worker processes (-1 = all CPUs)
+            batch_size: Number of texts buffered per batch
+            backend: "spacy" (exact) or "regex" (fast, lemmas mode only)
+
+        Returns:
+            List of result dictionaries, one per text, in input order
+        """
+        self._validate_backend(backend, mode)
+        if backend == "regex":
+            return [self._process_fast(text, mode) for text in texts]
+
+        docs = self.nlp.pipe(texts, disable=self.MODE_DISABLED[mode],
+                             n_process=n_process, batch_size=batch_size)
+        return [self._extract(doc, mode) for doc in docs]
+
+    def _validate_mode(self, mode: str) -> None:
+        """Reject unknown entity extraction modes."""
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown mode '{mode}', expected one of {self.MODES}")
+
+    def _validate_backend(self, backend: str, mode: str) -> None:
+        """Reject unknown backends and modes the backend cannot serve."""
+        self._validate_mode(mode)
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of {self.BACKENDS}")
+        if backend == "regex" and mode != "lemmas":
+            raise ValueError("The regex backend has no entity recognition; use mode='lemmas'")
+
+    def _process_fast(self, text: str, mode: str) -> Dict[str, Any]:
+        """Run the spaCy-free regex/lookup pipeline."""
+        tokens = self.fast_lemmatizer.process(text, self.stopwords)
+        return {"tokens": tokens, "entities": [], "mode": mode}
+
+    def _extract(self, doc: Doc, mode: str) -> Dict[str, Any]:
+        """Run preprocessing steps 2-7 on a parsed document.
+
+        Args:
+            doc: spaCy document (step 1: tokenization)
+            mode: Entity extraction mode
+
+        Returns:
+            Dictionary with tokens, entities and mode
+        """
+        entities = []
+        if mode in ("mixed", "entities"):
+            entities = [{"text": ent.text, "label": ent.label_} for ent in doc.ents]
+
+        if mode == "entities":
+            # Only entities, reduced to their root (lemma) form
+            tokens = [ent.lemma_.lower() for ent in doc.ents if ent.lemma_.strip()]
+            return {"tokens": tokens, "entities": entities, "mode": mode}
+
+        # Multi-word entities are preserved as single tokens in mixed mode
+        entity_starts = {}
+        if mode == "mixed":
+            entity_starts = {ent.start: ent for ent in doc.ents if len(ent) > 1}
+
+        tokens = []
+        i = 0
+        while i < len(doc):
+            ent = entity_starts.get(i)
+            if ent is not None:
+                tokens.append(ent.text.lower())
+                i = ent.end
+                continue
+
+            token = doc[i]
+            i += 1
+            if self._keep_token(token):
+                # 6. Lemmatization (AFTER stopwords)
+                tokens.append((token.lemma_ or token.text).lower())
+
+        return {"tokens": tokens, "entities": entities, "mode": mode}
+
+    def _keep_token(self, token: Token) -> bool:
+        """Apply filtering steps 2-5 to a single token."""
         # 2. Special character removal
+        if token.is_punct or token.is_space or not self.WORD_PATTERN.match(token.text):
+            return False
         # 3. URL removal
-        # 4. Number filtering
+        if token.like_url:
+            return False
+        # 4. Number filtering (numbers inside words are preserved)
+        if token.is_digit:
+            return False
         # 5. Stopwords removal (BEFORE lemmatization)
-        # 6. Lemmatization (AFTER stopwords)
-        # 7. Entity extraction
-        
-        return {
-            "tokens": [],
-            "entities": [],
-            "mode": mode
-        }
+        return token.lower_ not in self.stopwords
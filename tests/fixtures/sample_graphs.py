@@ -1,6 +1,7 @@
 """Sample graph data for testing"""
 
 import networkx as nx
+import numpy as np
 
 
 def create_sample_graph():
@@ -46,3 +47,12 @@ def create_disconnected_graph():
     G.add_edge("ai", "business", weight=1)
     
     return G
+
+
+def planted_graph(groups: int = 8, size: int = 25, seed: int = 3) -> nx.Graph:
+    """Planted-partition graph with integer co-occurrence style weights."""
+    graph = nx.planted_partition_graph(groups, size, 0.4, 0.02, seed=seed)
+    rng = np.random.default_rng(seed)
+    for u, v in graph.edges():
+        graph[u][v]["weight"] = int(rng.integers(1, 10))
+    return graph